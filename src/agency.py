@@ -1,33 +1,324 @@
-import os
+import argparse
+import asyncio
+import functools
+import logging
 import sys
-from dotenv import load_dotenv
-from agency_swarm import Agency
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import orjson
+from settings import get_settings
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+logger = logging.getLogger(__name__)
 
-from grok_sentiment_agent import get_grok_sentiment_agent  # noqa: E402
-from grok_narration_agent import get_grok_narration_agent  # noqa: E402
+# Parsed once here; the agent factories reuse the same cached instance
+settings = get_settings()
 
-# Load environment variables
-load_dotenv()
+GROK_MAX_CONCURRENCY = settings.grok_max_concurrency
+GROK_BATCH_SIZE = settings.grok_batch_size
 
-# Create agents
-grok_sentiment_agent = get_grok_sentiment_agent()
-grok_narration_agent = get_grok_narration_agent()
+# Prepended to batched messages by run_batch(); the full batch contract travels
+# with the message so single-token prompts never carry batch rules
+BATCH_REQUEST_PREFIX = (
+    "BATCH REQUEST\n"
+    "The JSON array below holds independent token requests. Process every request "
+    "exactly as if it had been sent on its own.\n"
+    "Reply with ONLY a JSON array of strings, one narrative per request, in the same "
+    "order and with the same length as the input.\n"
+    "Never merge, drop, or reorder requests; if one request fails, put a short error "
+    "note in its slot.\n\n"
+)
 
-# Create the agency with two-agent communication flow
-agency = Agency(
-    grok_sentiment_agent,  # Entry point
-    communication_flows=[
-        (grok_sentiment_agent, grok_narration_agent),
-    ],
-    shared_instructions="./shared_instructions.md",
+# Appended to the prompt when piped_run() drives the sentiment agent on its own
+SENTIMENT_ONLY_SUFFIX = (
+    "\n\nReturn only your sentiment analysis. Do not delegate to GrokNarrationAgent; "
+    "it will receive your analysis directly."
 )
 
+# Resolved once so the agency does not depend on the current working directory
+SHARED_INSTRUCTIONS_PATH = Path(__file__).resolve().parent / "shared_instructions.md"
+
+
+# Process-wide HTTP/2 pool for Grok calls; see get_shared_http_client()
+_http_client = None
+
+
+def get_shared_http_client():
+    """
+    Return the process-wide HTTP/2 connection pool used for all Grok calls.
+
+    Both agents talk to the xAI API through LiteLLM, which builds a new client
+    per model unless a session is provided, so one pool here means one TLS
+    handshake per connection instead of one per agent. Close it with
+    close_shared_http_client() on shutdown.
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        import httpx
+        import litellm
+
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+        litellm.aclient_session = _http_client
+
+    return _http_client
+
+
+async def close_shared_http_client():
+    """Close the shared Grok HTTP client; call on shutdown next to close_session()"""
+    global _http_client
+
+    if _http_client is None:
+        return
+
+    client, _http_client = _http_client, None
+    import litellm
+
+    # Never leave LiteLLM pointing at a closed client
+    if litellm.aclient_session is client:
+        litellm.aclient_session = None
+    await client.aclose()
+
+
+@functools.cache
+def get_agency():
+    """
+    Build the two-agent agency on first use; later calls return the same instance.
+
+    Agent SDK imports are deferred to here so importing this module stays cheap
+    for code paths that never talk to the agents.
+    """
+    from agency_swarm import Agency
+    from grok_sentiment_agent import get_grok_sentiment_agent
+    from grok_narration_agent import get_grok_narration_agent
+
+    # Route both agents through one pooled HTTP client
+    get_shared_http_client()
+
+    # Create agents concurrently - each factory loads its own tools and instructions
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sentiment_future = executor.submit(get_grok_sentiment_agent)
+        narration_future = executor.submit(get_grok_narration_agent)
+        grok_sentiment_agent = sentiment_future.result()
+        grok_narration_agent = narration_future.result()
+
+    # Create the agency with two-agent communication flow
+    return Agency(
+        grok_sentiment_agent,  # Entry point
+        communication_flows=[
+            (grok_sentiment_agent, grok_narration_agent),
+        ],
+        # Pass the text itself so the library never re-opens the file per agent
+        shared_instructions=SHARED_INSTRUCTIONS_PATH.read_text(encoding="utf-8"),
+    )
+
+
+async def run_many(prompts, concurrency=GROK_MAX_CONCURRENCY):
+    """
+    Run prompts through the agency with bounded concurrency and backpressure.
+
+    A fixed pool of workers pulls from a bounded queue, so at most `concurrency`
+    requests are in flight and at most `2 * concurrency` prompts are buffered,
+    however long the input is. If any request fails, the remaining work is
+    cancelled and the error is raised.
+
+    Args:
+        prompts: Messages to send to the entry-point agent (any iterable)
+        concurrency: Maximum number of conversations in flight at once
+
+    Returns:
+        List of final outputs in the same order as prompts
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    agency = get_agency()
+    queue = asyncio.Queue(maxsize=concurrency * 2)
+    results = {}
+
+    async def produce():
+        for item in enumerate(prompts):
+            # Blocks while the queue is full
+            await queue.put(item)
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def work():
+        while (item := await queue.get()) is not None:
+            index, prompt = item
+            response = await agency.get_response(prompt)
+            results[index] = response.final_output
+
+    tasks = [asyncio.create_task(produce())]
+    tasks += [asyncio.create_task(work()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return [results[index] for index in range(len(results))]
+
+
+async def piped_run(prompt):
+    """
+    Run the sentiment -> narration flow as an explicit two-stage pipeline.
+
+    The sentiment agent's text is streamed into a queue while a consumer task
+    collects it and starts the narration agent directly the moment the stream
+    ends. This skips the hand-off round trip through the sentiment agent (the
+    extra model turn that relays the narration back as a tool result).
+
+    Args:
+        prompt: Message with the pre-fetched token data
+
+    Returns:
+        Final narration output
+    """
+    agency = get_agency()
+    queue = asyncio.Queue()
+
+    async def stream_sentiment():
+        try:
+            async for event in agency.get_response_stream(
+                prompt + SENTIMENT_ONLY_SUFFIX,
+                recipient_agent="GrokSentimentAgent",
+            ):
+                data = getattr(event, "data", None)
+                if getattr(data, "type", None) == "response.output_text.delta":
+                    await queue.put(data.delta)
+        except BaseException as error:
+            # Hand the failure to the consumer instead of the end-of-stream
+            # sentinel, so a partial analysis is never narrated
+            await queue.put(error)
+            raise
+        await queue.put(None)
+
+    async def narrate():
+        chunks = []
+        while (chunk := await queue.get()) is not None:
+            if isinstance(chunk, BaseException):
+                raise chunk
+            chunks.append(chunk)
+
+        response = await agency.get_response(
+            f"{prompt}\n\nSENTIMENT ANALYSIS:\n{''.join(chunks)}",
+            recipient_agent="GrokNarrationAgent",
+        )
+        return response.final_output
+
+    producer = asyncio.create_task(stream_sentiment())
+    try:
+        return await narrate()
+    finally:
+        # The stream has ended once narrate() stops reading, unless the consumer
+        # itself was cancelled; its error, if any, was already raised above
+        if not producer.done():
+            producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+def _parse_batch_output(output, expected_count):
+    """Parse a batched reply into a list of strings, or None if it is malformed"""
+    if not isinstance(output, str):
+        return None
+
+    # Models sometimes wrap the array in a markdown code fence
+    start, end = output.find("["), output.rfind("]")
+    if start == -1 or end < start:
+        return None
+
+    try:
+        items = orjson.loads(output[start:end + 1])
+    except orjson.JSONDecodeError:
+        return None
+
+    if not isinstance(items, list) or len(items) != expected_count:
+        return None
+
+    return [item if isinstance(item, str) else orjson.dumps(item).decode() for item in items]
+
+
+async def run_batch(prompts, batch_size=GROK_BATCH_SIZE, concurrency=GROK_MAX_CONCURRENCY):
+    """
+    Run prompts through the agency with several prompts per request.
+
+    Each batch of up to batch_size prompts is sent as one JSON array message, so
+    the per-request overhead is paid once per batch instead of once per prompt.
+    Batches run through run_many(). A batch whose reply cannot be split back
+    into one answer per prompt is retried prompt by prompt.
+
+    Args:
+        prompts: Messages to send to the entry-point agent
+        batch_size: Maximum prompts per agency request
+        concurrency: Maximum number of batches in flight at once
+
+    Returns:
+        List of final outputs in the same order as prompts
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    batches = [prompts[i:i + batch_size] for i in range(0, len(prompts), batch_size)]
+    messages = [BATCH_REQUEST_PREFIX + orjson.dumps(batch).decode() for batch in batches]
+    outputs = await run_many(messages, concurrency=concurrency)
+
+    results = []
+    for batch, output in zip(batches, outputs):
+        parsed = _parse_batch_output(output, len(batch))
+        if parsed is None:
+            logger.warning("⚠️  Malformed batch reply - retrying %d prompts individually", len(batch))
+            parsed = await run_many(batch, concurrency=concurrency)
+        results.extend(parsed)
+
+    return results
+
+
+def install_uvloop():
+    """Use uvloop's event loop for asyncio.run() where it is available"""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def __getattr__(name):
+    # PEP 562: keeps `from agency import agency` working while building lazily
+    if name == "agency":
+        return get_agency()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
-    # Test the agency in terminal mode
+    parser = argparse.ArgumentParser(description="GoArlo agency demo")
+    parser.add_argument("prompts", nargs="*", help="Prompts to run concurrently (omit for interactive mode)")
+    parser.add_argument("--batch", metavar="FILE", help="JSON file containing an array of prompts to run")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=GROK_MAX_CONCURRENCY,
+        help=f"Maximum concurrent conversations (default: {GROK_MAX_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help="Pack this many prompts into each agency request (default: one request per prompt)"
+    )
+    parser.add_argument("--terminal", action="store_true", help="Use the blocking terminal demo")
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.batch_size < 0:
+        parser.error("--batch-size must not be negative")
+
     print("GoArlo Crypto Summary Bot Agency")
     print("=" * 40)
     print("This agency processes sentiment analysis and narrative generation.")
@@ -35,4 +326,25 @@ if __name__ == "__main__":
     print("Use main.py for complete workflow including data fetching.")
     print()
 
-    agency.terminal_demo()
+    prompts = list(args.prompts)
+    if args.batch:
+        prompts += orjson.loads(Path(args.batch).read_bytes())
+
+    async def run_prompts():
+        try:
+            if args.batch_size > 1:
+                return await run_batch(prompts, args.batch_size, concurrency=args.concurrency)
+            return await run_many(prompts, concurrency=args.concurrency)
+        finally:
+            await close_shared_http_client()
+
+    if prompts and not args.terminal:
+        install_uvloop()
+        outputs = asyncio.run(run_prompts())
+        for prompt, output in zip(prompts, outputs):
+            print(f"> {prompt}")
+            print(output)
+            print()
+    else:
+        # Interactive fallback
+        get_agency().terminal_demo()
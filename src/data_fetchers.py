@@ -7,18 +7,274 @@ import os
 import aiohttp
 import asyncio
 import json
+import logging
+import functools
+import math
+import random
+import re
+import sys
 import time
+import weakref
+import orjson
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
 from typing import Optional, Dict, Any, Union, List, Tuple
 from pydantic import BaseModel
+from cachetools import LRUCache, TLRUCache, TTLCache
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# API credentials and headers, read once at import (after load_dotenv)
+BIRDEYE_API_KEY = os.getenv("BIRDEYE_API_KEY")
+BIRDEYE_BASE_URL = "https://public-api.birdeye.so"
+BIRDEYE_BASE_HEADERS = {"X-API-KEY": BIRDEYE_API_KEY or "", "Accept": "application/json"}
+
+MORALIS_API_KEY = os.getenv("MORALIS_API_KEY")
+MORALIS_HEADERS = {"X-API-Key": MORALIS_API_KEY or "", "Accept": "application/json"}
+
 # Supported chains for token analysis
 SUPPORTED_CHAINS = ["solana", "ethereum", "base", "bsc", "shibarium"]
 
+# Map our chain names to BirdEye's expected values (unknown names pass through)
+BIRDEYE_CHAIN_MAP = {
+    "solana": "solana",
+    "ethereum": "ethereum",
+    "base": "base",
+    "bnb": "bsc",
+    "bsc": "bsc",
+    "shibarium": "shibarium",
+}
+
+# Map EVM chain names to Moralis chain names
+MORALIS_CHAIN_MAP = {
+    "ethereum": "eth",
+    "base": "base",
+    "bnb": "bsc",
+    "bsc": "bsc",  # Support both "bnb" and "bsc" as input
+}
+
+# Prebuilt BirdEye headers for each known chain (shared, never mutated)
+BIRDEYE_HEADERS_BY_CHAIN = {
+    birdeye_chain: {**BIRDEYE_BASE_HEADERS, "x-chain": birdeye_chain}
+    for birdeye_chain in set(BIRDEYE_CHAIN_MAP.values())
+}
+
+
+def birdeye_headers(birdeye_chain: str) -> Dict[str, str]:
+    """Return BirdEye request headers for a BirdEye chain name"""
+    headers = BIRDEYE_HEADERS_BY_CHAIN.get(birdeye_chain)
+    if headers is None:
+        headers = {**BIRDEYE_BASE_HEADERS, "x-chain": birdeye_chain}
+    return headers
+
+
+class RateLimiter:
+    """
+    Token bucket that caps both request rate and concurrency for one API.
+
+    Up to `rate` requests may start per `period` seconds, with bursts allowed
+    after idle time, and at most `max_concurrency` run at once. Use as
+    `async with limiter:` around each request so every call site shares the
+    same budget.
+    """
+
+    def __init__(self, rate: int, period: float = 1.0, max_concurrency: int = 10):
+        self.rate = rate
+        self.period = period
+        self.max_concurrency = max_concurrency
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        # asyncio primitives are bound to a loop, so keep one semaphore per loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _take_token(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.period)
+        self._updated = now
+
+        # Reserve a token now; if the bucket is in debt, wait until it is repaid
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens * self.period / self.rate)
+
+    async def __aenter__(self):
+        semaphore = self._semaphore()
+        await semaphore.acquire()
+        try:
+            await self._take_token()
+        except BaseException:
+            semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore().release()
+
+
+class CircuitBreaker:
+    """
+    Fails fast on an API that keeps erroring instead of waiting on every call.
+
+    CLOSED lets calls through. After `failure_threshold` consecutive failures
+    (5xx, 429, timeouts, connection errors) the breaker OPENs and refuses calls
+    for `recovery_timeout` seconds, then lets one trial call through
+    (HALF_OPEN) whose outcome closes or re-opens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "CLOSED"
+        self.failure_count = 0
+        self.opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be made now"""
+        if self.state == "CLOSED":
+            return True
+
+        # OPEN, or HALF_OPEN with a trial call that never reported back
+        if time.monotonic() - self.opened_at < self.recovery_timeout:
+            return False
+
+        self.state = "HALF_OPEN"
+        self.opened_at = time.monotonic()
+        return True
+
+    def record_success(self) -> None:
+        if self.state != "CLOSED":
+            logger.info("✅ %s circuit closed - API recovered", self.name)
+        self.state = "CLOSED"
+        self.failure_count = 0
+
+    def record_failure(self) -> None:
+        self.failure_count += 1
+        if self.state == "HALF_OPEN" or self.failure_count >= self.failure_threshold:
+            if self.state != "OPEN":
+                logger.warning(
+                    "⚠️  %s circuit opened after %d failures - pausing calls for %.0fs",
+                    self.name,
+                    self.failure_count,
+                    self.recovery_timeout
+                )
+            self.state = "OPEN"
+            self.opened_at = time.monotonic()
+
+    def record_response(self, status: int) -> None:
+        """Record an HTTP response; only server errors and rate limiting count as failures"""
+        if status >= 500 or status == 429:
+            self.record_failure()
+        else:
+            self.record_success()
+
+
+# Sentiment bands for analyze_24h_market_health. Each table pairs ascending
+# thresholds with one (points, factor) band per interval; a None factor adds no
+# text. Bands bounded by "value > threshold" are found with bisect_left, bands
+# bounded by "value < threshold" with bisect_right.
+PRICE_CHANGE_THRESHOLDS = (-5, 0, 5, 10)
+PRICE_CHANGE_BANDS = (
+    (0, "Significant price decline ({:+.1f}%)"),
+    (5, "Minor price decline ({:+.1f}%)"),
+    (15, "Slight price increase ({:+.1f}%)"),
+    (25, "Positive price movement ({:+.1f}%)"),
+    (40, "Strong price growth ({:+.1f}%)"),
+)
+
+BUY_PRESSURE_THRESHOLDS = (45, 55, 65)
+BUY_PRESSURE_BANDS = (
+    (0, None),
+    (10, "Balanced buy/sell pressure"),
+    (20, "Strong buy pressure ({:.1f}%)"),
+    (30, "Dominant buy pressure ({:.1f}%)"),
+)
+
+# Declining volume means strictly below -30%, hence the next float down
+VOLUME_CHANGE_THRESHOLDS = (math.nextafter(-30, -math.inf), 0, 50)
+VOLUME_CHANGE_BANDS = (
+    (0, "Declining volume ({:+.1f}%)"),
+    (0, None),
+    (10, "Growing volume ({:+.1f}%)"),
+    (20, "Increasing volume trend ({:+.1f}%)"),
+)
+
+VOLATILITY_THRESHOLDS = (5, 15)
+VOLATILITY_BANDS = (
+    (10, "Low volatility (stable)"),
+    (5, "Moderate volatility"),
+    (0, "High volatility"),
+)
+
+# Market health by sentiment score (lower bounds are inclusive)
+MARKET_HEALTH_THRESHOLDS = (45, 60, 75)
+MARKET_HEALTH_LEVELS = ("LOW", "FAIR", "GOOD", "EXCELLENT")
+
+
+# BirdEye allows 5 requests per second per API key
+birdeye_limiter = RateLimiter(rate=5, period=1.0, max_concurrency=5)
+
+# Moralis pages are paced at 5 requests per second
+moralis_limiter = RateLimiter(rate=5, period=1.0, max_concurrency=5)
+
+# One breaker per provider so a BirdEye outage does not block Moralis calls
+birdeye_breaker = CircuitBreaker("BirdEye")
+moralis_breaker = CircuitBreaker("Moralis")
+
+# Default timeout for requests made through the shared session
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+# Process-wide pooled session, created lazily by get_session()
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# How long fetched OHLCV candles stay fresh, by timeframe (seconds)
+OHLCV_CACHE_TTL = {"15m": 60, "1H": 300, "1D": 3600}
+OHLCV_CACHE_DEFAULT_TTL = 300
+
+# Windows that ended over a day ago only hold closed candles, which never change
+OHLCV_HISTORICAL_AGE = 86400
+OHLCV_HISTORICAL_TTL = 86400
+
+# Cache OHLCV responses; entries expire per their timeframe's TTL, or after
+# OHLCV_HISTORICAL_TTL for historical windows (flagged last in the key)
+ohlcv_cache = TLRUCache(
+    maxsize=512,
+    ttu=lambda key, value, now: now + (
+        OHLCV_HISTORICAL_TTL if key[-1] else OHLCV_CACHE_TTL.get(key[2], OHLCV_CACHE_DEFAULT_TTL)
+    )
+)
+
+# OHLCV requests currently in flight, keyed like ohlcv_cache. Futures are bound
+# to the loop that created them, so keep one map per loop (as RateLimiter does)
+_ohlcv_inflight = weakref.WeakKeyDictionary()
+
+# Holder stats move slowly, so reuse them for 30 minutes per (chain, token)
+holder_data_cache = TTLCache(maxsize=10_000, ttl=1800)
+
+# Creation info never changes once a token exists; only successes are cached
+creation_info_cache = LRUCache(maxsize=50_000)
+
+# Launch-time bundling says little about tokens older than this, so the
+# bundler analysis (and its 300-transaction Moralis fetch) is skipped for them
+BUNDLER_MAX_TOKEN_AGE_DAYS = 30
+
+# Absorbs bursts of repeated requests (e.g. dashboard refreshes) per (chain, token)
+market_data_cache = TTLCache(maxsize=1024, ttl=30)
+
+
 class TokenMarketData(BaseModel):
     """Market data from BirdEye API"""
 
@@ -92,6 +348,9 @@ def safe_float(value: Union[str, int, float, None], default: float = 0.0) -> flo
     """
     Safely convert a value to float, handling None and invalid values.
     """
+    # Fast path: JSON numbers with a fraction already decode to float
+    if type(value) is float:
+        return value
     if value is None:
         return default
     try:
@@ -105,6 +364,62 @@ def iso_timestamp(unix_ts: int) -> str:
     return datetime.fromtimestamp(unix_ts, tz=timezone.utc).isoformat()
 
 
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared HTTP session, creating it on first use.
+
+    Reusing one session keeps connections (and their TLS handshakes) alive
+    between API calls. A new session is created if the previous one was
+    closed or belongs to a different event loop (e.g. a later asyncio.run()).
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        _session = aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT)
+        _session_loop = loop
+
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session; call on application shutdown"""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+
+
+def retry_network_errors(attempts: int = 3, initial_delay: float = 0.2, max_delay: float = 2.0):
+    """
+    Retry an async call on connection errors and timeouts.
+
+    Waits a random time up to an exponentially growing cap between attempts
+    (full jitter), so concurrent callers do not retry in lockstep. HTTP error
+    statuses are not retried; the circuit breakers handle persistent failures.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    if attempt == attempts - 1:
+                        raise
+                    await asyncio.sleep(random.uniform(0, min(max_delay, initial_delay * 2 ** attempt)))
+        return wrapper
+    return decorator
 
 
 async def fetch_ohlcv_data(
@@ -127,29 +442,24 @@ async def fetch_ohlcv_data(
     Returns:
         List of OHLCV candle data
     """
-    api_key = os.getenv("BIRDEYE_API_KEY")
-    if not api_key:
-        print("⚠️  BIRDEYE_API_KEY not set - skipping OHLCV analysis")
+    if not BIRDEYE_API_KEY:
+        logger.warning("⚠️  BIRDEYE_API_KEY not set - skipping OHLCV analysis")
         return []
 
-    # Map chain names to BirdEye format
-    chain_map = {
-        "solana": "solana",
-        "ethereum": "ethereum",
-        "base": "base",
-        "bnb": "bsc",
-        "bsc": "bsc",
-        "shibarium": "shibarium"
-    }
+    chain = chain.lower()
+    birdeye_chain = BIRDEYE_CHAIN_MAP.get(chain, chain)
 
-    birdeye_chain = chain_map.get(chain.lower(), chain.lower())
+    # Windows ending "now" shift every second, so key on TTL-sized buckets
+    ttl = OHLCV_CACHE_TTL.get(timeframe, OHLCV_CACHE_DEFAULT_TTL)
+    historical = time_to < time.time() - OHLCV_HISTORICAL_AGE
+    cache_key = (token_address, birdeye_chain, timeframe, time_from // ttl, time_to // ttl, historical)
+    cached_items = ohlcv_cache.get(cache_key)
+    if cached_items is not None:
+        logger.info("📊 Using cached OHLCV data (%d %s candles)", len(cached_items), timeframe)
+        return cached_items
 
-    base_url = "https://public-api.birdeye.so"
-    headers = {
-        "X-API-KEY": api_key,
-        "x-chain": birdeye_chain,
-        "Accept": "application/json"
-    }
+    base_url = BIRDEYE_BASE_URL
+    headers = birdeye_headers(birdeye_chain)
 
     url = f"{base_url}/defi/v3/ohlcv"
     params = {
@@ -161,35 +471,97 @@ async def fetch_ohlcv_data(
         "ui_amount_mode": "raw"
     }
 
-    print(f"📊 Fetching OHLCV data for price action analysis...")
-    print(f"   Time range: {datetime.fromtimestamp(time_from)} to {datetime.fromtimestamp(time_to)}")
-    print(f"   Timeframe: {timeframe}")
+    # Collapse concurrent identical requests into one upstream call; shielded
+    # so one caller being cancelled does not cancel the shared request
+    loop = asyncio.get_running_loop()
+    inflight = _ohlcv_inflight.get(loop)
+    if inflight is None:
+        inflight = _ohlcv_inflight[loop] = {}
+    if cache_key in inflight:
+        logger.info("📊 Joining in-flight OHLCV request (%s)", timeframe)
+        return await asyncio.shield(inflight[cache_key])
+
+    # Lazy %-formatting: nothing is formatted when INFO is disabled
+    logger.info(
+        "📊 Fetching OHLCV data: timeframe=%s from=%s to=%s",
+        timeframe,
+        time_from,
+        time_to
+    )
 
-    async with aiohttp.ClientSession() as session:
-        # Add rate limiting
-        await asyncio.sleep(0.2)
+    request = asyncio.ensure_future(_request_ohlcv(url, headers, params, cache_key))
+    inflight[cache_key] = request
+    request.add_done_callback(lambda _: inflight.pop(cache_key, None))
+    return await asyncio.shield(request)
 
-        try:
-            async with session.get(url, headers=headers, params=params, timeout=30) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    print(f"⚠️  BirdEye OHLCV API error: {response.status} - {error_text}")
-                    return []
 
-                data = await response.json()
+async def fetch_ohlcv_batch(
+    requests: List[Tuple[str, str, int, int, str]],
+    max_concurrent: int = 20
+) -> List[List[Dict[str, Any]]]:
+    """
+    Fetch OHLCV data for many tokens/windows concurrently.
 
-                if not data.get("success") or not data.get("data", {}).get("items"):
-                    print(f"⚠️  No OHLCV data available for this token")
-                    return []
+    Each request goes through fetch_ohlcv_data, so results are cached and
+    deduplicated, and BirdEye's rate limit still applies across the batch.
 
-                items = data["data"]["items"]
-                print(f"✅ Fetched {len(items)} OHLCV candles")
+    Args:
+        requests: (token_address, chain, time_from, time_to, timeframe) tuples
+        max_concurrent: Maximum number of requests in flight at once
 
-                return items
+    Returns:
+        List of candle lists in the same order as requests
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
 
-        except Exception as e:
-            print(f"❌ Error fetching OHLCV data: {str(e)}")
-            return []
+    async def fetch_one(token_address, chain, time_from, time_to, timeframe):
+        async with semaphore:
+            return await fetch_ohlcv_data(token_address, time_from, time_to, chain, timeframe)
+
+    return await asyncio.gather(*(fetch_one(*request) for request in requests))
+
+
+async def _request_ohlcv(
+    url: str,
+    headers: Dict[str, str],
+    params: Dict[str, Any],
+    cache_key: Tuple
+) -> List[Dict[str, Any]]:
+    """Perform the BirdEye OHLCV request for fetch_ohlcv_data and cache the result"""
+    if not birdeye_breaker.allow_request():
+        logger.warning("⚠️  BirdEye circuit open - skipping OHLCV request")
+        return []
+
+    session = await get_session()
+
+    try:
+        async with birdeye_limiter, session.get(url, headers=headers, params=params) as response:
+            birdeye_breaker.record_response(response.status)
+            if response.status != 200:
+                error_text = await response.text()
+                logger.warning("⚠️  BirdEye OHLCV API error: %s - %s", response.status, error_text)
+                return []
+
+            # orjson decodes the candle payload faster than the stdlib json module
+            data = orjson.loads(await response.read())
+
+            if not data.get("success") or not data.get("data", {}).get("items"):
+                logger.info("⚠️  No OHLCV data available for this token")
+                return []
+
+            items = data["data"]["items"]
+            logger.info("✅ Fetched %d OHLCV candles", len(items))
+
+            ohlcv_cache[cache_key] = items
+            return items
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        birdeye_breaker.record_failure()
+        logger.error("❌ Error fetching OHLCV data: %s", str(e) or type(e).__name__)
+        return []
+    except Exception as e:
+        logger.error("❌ Error fetching OHLCV data: %s", e)
+        return []
 
 
 def analyze_price_action_selloff(
@@ -217,14 +589,42 @@ def analyze_price_action_selloff(
     # Sort candles by time
     sorted_candles = sorted(ohlcv_data, key=lambda x: x.get("unix_time", 0))
 
-    # Extract price data
-    highs = [safe_float(candle.get("h", 0)) for candle in sorted_candles]
-    lows = [safe_float(candle.get("l", 0)) for candle in sorted_candles]
-    opens = [safe_float(candle.get("o", 0)) for candle in sorted_candles]
-    closes = [safe_float(candle.get("c", 0)) for candle in sorted_candles]
-    volumes = [safe_float(candle.get("v_usd", 0)) for candle in sorted_candles]
+    # Single pass: extract prices and collect volatility and large drops as we go
+    opens = []
+    closes = []
+    volumes = []
+    peak_price = None
+    daily_ranges = []
+    large_drops = []
+    prev_close = 0.0
+
+    for i, candle in enumerate(sorted_candles):
+        high = safe_float(candle.get("h", 0))
+        low = safe_float(candle.get("l", 0))
+        close = safe_float(candle.get("c", 0))
+        opens.append(safe_float(candle.get("o", 0)))
+        closes.append(close)
+        volumes.append(safe_float(candle.get("v_usd", 0)))
 
-    if not highs or max(highs) == 0:
+        if peak_price is None or high > peak_price:
+            peak_price = high
+
+        # Volatility (high-low range)
+        if high > 0 and low > 0:
+            daily_ranges.append((high - low) / low * 100)
+
+        # Large single-day drops
+        if i > 0 and prev_close > 0:
+            daily_change = (close - prev_close) / prev_close * 100
+            if daily_change < -20:  # More than 20% drop in a day
+                large_drops.append({
+                    "day": i,
+                    "drop_percent": abs(daily_change),
+                    "unix_time": candle.get("unix_time", 0)
+                })
+        prev_close = close
+
+    if not peak_price:
         return {
             "selloff_detected": False,
             "selloff_severity": "UNKNOWN",
@@ -232,52 +632,20 @@ def analyze_price_action_selloff(
             "data_points": len(sorted_candles)
         }
 
-    # Calculate key metrics
-    peak_price = max(highs)
-    peak_index = highs.index(peak_price)
-    current_price = closes[-1] if closes else 0
-
     # Calculate price decline from peak
+    current_price = closes[-1]
     price_decline_pct = ((peak_price - current_price) / peak_price * 100) if peak_price > 0 else 0
 
-    # Calculate volatility (high-low ranges)
-    daily_ranges = []
-    for i, candle in enumerate(sorted_candles):
-        high = highs[i]
-        low = lows[i]
-        if high > 0 and low > 0:
-            daily_range_pct = ((high - low) / low * 100)
-            daily_ranges.append(daily_range_pct)
-
     avg_volatility = sum(daily_ranges) / len(daily_ranges) if daily_ranges else 0
     max_volatility = max(daily_ranges) if daily_ranges else 0
 
-    # Detect large single-day drops
-    large_drops = []
-    for i in range(1, len(closes)):
-        if closes[i-1] > 0:
-            daily_change = ((closes[i] - closes[i-1]) / closes[i-1] * 100)
-            if daily_change < -20:  # More than 20% drop in a day
-                large_drops.append({
-                    "day": i,
-                    "drop_percent": abs(daily_change),
-                    "unix_time": sorted_candles[i].get("unix_time", 0)
-                })
-
-    # Volume analysis - detect high volume sell-offs
-    if volumes and len(volumes) > 1:
-        avg_volume = sum(volumes) / len(volumes)
-        high_volume_days = [
-            {
-                "day": i,
-                "volume_multiple": volumes[i] / avg_volume if avg_volume > 0 else 0,
-                "price_change": ((closes[i] - opens[i]) / opens[i] * 100) if opens[i] > 0 else 0
-            }
-            for i in range(len(volumes))
-            if volumes[i] > avg_volume * 2  # More than 2x average volume
-        ]
-    else:
-        high_volume_days = []
+    # Volume analysis - count high volume (more than 2x average) sell-off candles
+    avg_volume = sum(volumes) / len(volumes)
+    high_vol_selloffs = sum(
+        1
+        for open_price, close, volume in zip(opens, closes, volumes)
+        if volume > avg_volume * 2 and open_price > 0 and (close - open_price) / open_price * 100 < -10
+    )
 
     # Determine sell-off severity
     selloff_severity = "NONE"
@@ -305,10 +673,8 @@ def analyze_price_action_selloff(
         selloff_detected = True
         risk_factors.append(f"{len(large_drops)} large single-day drops detected")
 
-    if len(high_volume_days) > 0:
-        high_vol_selloffs = [day for day in high_volume_days if day["price_change"] < -10]
-        if high_vol_selloffs:
-            risk_factors.append(f"{len(high_vol_selloffs)} high-volume sell-off days")
+    if high_vol_selloffs:
+        risk_factors.append(f"{high_vol_selloffs} high-volume sell-off days")
 
     # Risk mitigation assessment
     mitigation_factor = "NONE"
@@ -328,7 +694,7 @@ def analyze_price_action_selloff(
         "current_price": current_price,
         "large_drops_count": len(large_drops),
         "large_drops": large_drops,
-        "high_volume_selloffs": len([day for day in high_volume_days if day["price_change"] < -10]),
+        "high_volume_selloffs": high_vol_selloffs,
         "avg_daily_volatility_pct": round(avg_volatility, 1),
         "max_daily_volatility_pct": round(max_volatility, 1),
         "risk_mitigation_factor": mitigation_factor,
@@ -355,7 +721,7 @@ async def analyze_24h_market_health(
     current_time = int(time.time())
     time_24h_ago = current_time - (24 * 60 * 60)  # 24 hours ago
 
-    print(f"📊 Analyzing 24h market health for {chain}...")
+    logger.info("📊 Analyzing 24h market health for %s...", chain)
 
     # Fetch 15-minute candles for detailed analysis
     ohlcv_data = await fetch_ohlcv_data(
@@ -376,36 +742,32 @@ async def analyze_24h_market_health(
     # Sort candles by time
     sorted_candles = sorted(ohlcv_data, key=lambda x: x.get("unix_time", 0))
 
-    # Extract price and volume data
-    opens = [safe_float(candle.get("o", 0)) for candle in sorted_candles]
-    highs = [safe_float(candle.get("h", 0)) for candle in sorted_candles]
-    lows = [safe_float(candle.get("l", 0)) for candle in sorted_candles]
-    closes = [safe_float(candle.get("c", 0)) for candle in sorted_candles]
-    volumes = [safe_float(candle.get("v_usd", 0)) for candle in sorted_candles]
-
-    if not closes or max(closes) == 0:
-        return {
-            "market_health_available": False,
-            "analysis_note": "No valid price data in 24h window",
-            "data_points": len(sorted_candles)
-        }
-
-    # Calculate 24h metrics
-    h24_high = max(highs)
-    h24_low = min(lows)
-    current_price = closes[-1]
-    start_price = opens[0]
-
-    price_change_24h = ((current_price - start_price) / start_price * 100) if start_price > 0 else 0
-
-    # Calculate buy/sell pressure using price action analysis
+    # Single pass: price extremes, buy/sell pressure, volume halves and volatility
+    mid_point = len(sorted_candles) // 2
+    h24_high = h24_low = max_close = None
+    start_price = current_price = 0.0
     buy_pressure_periods = 0
     sell_pressure_periods = 0
-    neutral_periods = 0
+    total_volume = 0.0
+    first_half_volume = 0.0
+    second_half_volume = 0.0
+    volatility_periods = []
 
     for i, candle in enumerate(sorted_candles):
-        open_price = opens[i]
-        close_price = closes[i]
+        open_price = safe_float(candle.get("o", 0))
+        high = safe_float(candle.get("h", 0))
+        low = safe_float(candle.get("l", 0))
+        close_price = safe_float(candle.get("c", 0))
+        volume = safe_float(candle.get("v_usd", 0))
+
+        if i == 0:
+            start_price = open_price
+            h24_high, h24_low, max_close = high, low, close_price
+        else:
+            h24_high = max(h24_high, high)
+            h24_low = min(h24_low, low)
+            max_close = max(max_close, close_price)
+        current_price = close_price
 
         if close_price > open_price:
             # Green candle = buy pressure
@@ -413,8 +775,26 @@ async def analyze_24h_market_health(
         elif close_price < open_price:
             # Red candle = sell pressure
             sell_pressure_periods += 1
+
+        # Volume totals, split into first and second half of the window
+        total_volume += volume
+        if i < mid_point:
+            first_half_volume += volume
         else:
-            neutral_periods += 1
+            second_half_volume += volume
+
+        # Volatility for market health assessment
+        if high > 0 and low > 0:
+            volatility_periods.append((high - low) / low * 100)
+
+    if max_close == 0:
+        return {
+            "market_health_available": False,
+            "analysis_note": "No valid price data in 24h window",
+            "data_points": len(sorted_candles)
+        }
+
+    price_change_24h = ((current_price - start_price) / start_price * 100) if start_price > 0 else 0
 
     total_periods = len(sorted_candles)
     buy_pressure_pct = (buy_pressure_periods / total_periods * 100) if total_periods > 0 else 0
@@ -433,85 +813,31 @@ async def analyze_24h_market_health(
         pressure_dominance = "NEUTRAL"
 
     # Calculate volume metrics using actual OHLCV data
-    total_volume = sum(volumes)
-    avg_volume_per_period = total_volume / len(volumes) if volumes else 0
-
-    # Calculate volatility for market health assessment
-    volatility_periods = []
-    for i in range(len(sorted_candles)):
-        if highs[i] > 0 and lows[i] > 0:
-            volatility = ((highs[i] - lows[i]) / lows[i] * 100)
-            volatility_periods.append(volatility)
+    avg_volume_per_period = total_volume / total_periods
 
     avg_volatility = sum(volatility_periods) / len(volatility_periods) if volatility_periods else 0
 
     # Volume change analysis (compare first half vs second half of 24h)
-    mid_point = len(volumes) // 2
-    first_half_volume = sum(volumes[:mid_point]) if mid_point > 0 else 0
-    second_half_volume = sum(volumes[mid_point:]) if mid_point < len(volumes) else 0
-
     volume_change = ((second_half_volume - first_half_volume) / first_half_volume * 100) if first_half_volume > 0 else 0
 
-    # Market sentiment assessment
+    # Market sentiment assessment: price (40), buy pressure (30), volume trend (20)
+    # and volatility (10) points, each looked up in its band table
     sentiment_factors = []
     sentiment_score = 0
 
-    # Price performance factor (40 points max)
-    if price_change_24h > 10:
-        sentiment_score += 40
-        sentiment_factors.append(f"Strong price growth ({price_change_24h:+.1f}%)")
-    elif price_change_24h > 5:
-        sentiment_score += 25
-        sentiment_factors.append(f"Positive price movement ({price_change_24h:+.1f}%)")
-    elif price_change_24h > 0:
-        sentiment_score += 15
-        sentiment_factors.append(f"Slight price increase ({price_change_24h:+.1f}%)")
-    elif price_change_24h > -5:
-        sentiment_score += 5
-        sentiment_factors.append(f"Minor price decline ({price_change_24h:+.1f}%)")
-    else:
-        sentiment_factors.append(f"Significant price decline ({price_change_24h:+.1f}%)")
-
-    # Buy pressure factor (30 points max)
-    if buy_pressure_pct > 65:
-        sentiment_score += 30
-        sentiment_factors.append(f"Dominant buy pressure ({buy_pressure_pct:.1f}%)")
-    elif buy_pressure_pct > 55:
-        sentiment_score += 20
-        sentiment_factors.append(f"Strong buy pressure ({buy_pressure_pct:.1f}%)")
-    elif buy_pressure_pct > 45:
-        sentiment_score += 10
-        sentiment_factors.append("Balanced buy/sell pressure")
-
-    # Volume trend factor (20 points max)
-    if volume_change > 50:
-        sentiment_score += 20
-        sentiment_factors.append(f"Increasing volume trend ({volume_change:+.1f}%)")
-    elif volume_change > 0:
-        sentiment_score += 10
-        sentiment_factors.append(f"Growing volume ({volume_change:+.1f}%)")
-    elif volume_change < -30:
-        sentiment_factors.append(f"Declining volume ({volume_change:+.1f}%)")
-
-    # Volatility assessment (10 points max)
-    if avg_volatility < 5:
-        sentiment_score += 10
-        sentiment_factors.append("Low volatility (stable)")
-    elif avg_volatility < 15:
-        sentiment_score += 5
-        sentiment_factors.append("Moderate volatility")
-    else:
-        sentiment_factors.append("High volatility")
+    for value, thresholds, bands, search in (
+        (price_change_24h, PRICE_CHANGE_THRESHOLDS, PRICE_CHANGE_BANDS, bisect_left),
+        (buy_pressure_pct, BUY_PRESSURE_THRESHOLDS, BUY_PRESSURE_BANDS, bisect_left),
+        (volume_change, VOLUME_CHANGE_THRESHOLDS, VOLUME_CHANGE_BANDS, bisect_left),
+        (avg_volatility, VOLATILITY_THRESHOLDS, VOLATILITY_BANDS, bisect_right),
+    ):
+        points, factor = bands[search(thresholds, value)]
+        sentiment_score += points
+        if factor:
+            sentiment_factors.append(factor.format(value))
 
     # Determine overall market health
-    if sentiment_score >= 75:
-        market_health = "EXCELLENT"
-    elif sentiment_score >= 60:
-        market_health = "GOOD"
-    elif sentiment_score >= 45:
-        market_health = "FAIR"
-    else:
-        market_health = "LOW"
+    market_health = MARKET_HEALTH_LEVELS[bisect_right(MARKET_HEALTH_THRESHOLDS, sentiment_score)]
 
     return {
         "market_health_available": True,
@@ -534,15 +860,59 @@ async def analyze_24h_market_health(
     }
 
 
+def index_sample_transactions(
+    bundle_clusters: List[BundleCluster],
+    transactions: List[Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Map each cluster sample tx_hash to its transaction in a single scan.
+
+    Only sample hashes are indexed, and the first occurrence of a duplicate
+    hash wins.
+    """
+    sample_hashes = {tx_hash for cluster in bundle_clusters for tx_hash in cluster.sample_txs}
+    tx_by_hash = {}
+    for tx in transactions:
+        tx_hash = tx.get("tx_hash")
+        if tx_hash in sample_hashes and tx_hash not in tx_by_hash:
+            tx_by_hash[tx_hash] = tx
+    return tx_by_hash
+
+
+def cluster_start_gaps(bundle_clusters: List[BundleCluster]) -> List[int]:
+    """Seconds between consecutive bundle cluster starts, in time order"""
+    starts = sorted(cluster.first_unix for cluster in bundle_clusters)
+    return [later - earlier for earlier, later in zip(starts, starts[1:])]
+
+
+def count_transactions_in_clusters(
+    bundle_clusters: List[BundleCluster],
+    transactions: List[Dict[str, Any]]
+) -> int:
+    """Count transactions falling inside any cluster's time window, each counted once"""
+    times = sorted(tx.get("block_unix_time") or tx.get("blockUnixTime", 0) for tx in transactions)
+
+    # Merge overlapping windows so every transaction is counted in one interval
+    merged = []
+    for start, end in sorted((c.first_unix, c.first_unix + c.window_seconds) for c in bundle_clusters):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    return sum(bisect_right(times, end) - bisect_left(times, start) for start, end in merged)
+
+
 def coefficient_of_variation(values: List[float]) -> float:
     """Calculate coefficient of variation for a list of values"""
     if len(values) < 2:
         return 0.0
-    mean = sum(values) / len(values)
+    # fsum keeps the sums exact, avoiding cancellation on large unix-time gaps
+    mean = math.fsum(values) / len(values)
     if mean == 0:
         return 0.0
-    variance = sum((v - mean) ** 2 for v in values) / (len(values) - 1)
-    return (variance ** 0.5) / abs(mean)
+    variance = math.fsum([(v - mean) ** 2 for v in values]) / (len(values) - 1)
+    return math.sqrt(variance) / abs(mean)
 
 
 def calculate_bundle_risk_metrics(
@@ -575,31 +945,20 @@ def calculate_bundle_risk_metrics(
     ))
 
     # 2. Wallet Concentration Risk (0-1)
-    # Analyze unique wallets across all bundles
-    all_bundled_wallets = set()
-    for cluster in bundle_clusters:
-        # Extract wallets from sample transactions
-        for tx_hash in cluster.sample_txs:
-            # Find the transaction in our data
-            for tx in transactions:
-                if tx.get("tx_hash") == tx_hash:
-                    wallet = tx.get("owner", "")
-                    if wallet:
-                        all_bundled_wallets.add(wallet)
-                    break
-
-    # Check for wallet reuse across different bundles
+    # Count how often each wallet appears in bundle sample transactions
+    tx_by_hash = index_sample_transactions(bundle_clusters, transactions)
     wallet_appearances = {}
     for cluster in bundle_clusters:
-        cluster_wallets = set()
         for tx_hash in cluster.sample_txs:
-            for tx in transactions:
-                if tx.get("tx_hash") == tx_hash:
-                    wallet = tx.get("owner", "")
-                    if wallet:
-                        cluster_wallets.add(wallet)
-                        wallet_appearances[wallet] = wallet_appearances.get(wallet, 0) + 1
-                    break
+            tx = tx_by_hash.get(tx_hash)
+            if tx is None:
+                continue
+            wallet = tx.get("owner", "")
+            if wallet:
+                wallet_appearances[wallet] = wallet_appearances.get(wallet, 0) + 1
+
+    # Unique wallets across all bundles
+    all_bundled_wallets = wallet_appearances.keys()
 
     # Higher concentration = more wallets appearing in multiple bundles
     multi_bundle_wallets = sum(1 for count in wallet_appearances.values() if count > 1)
@@ -607,11 +966,7 @@ def calculate_bundle_risk_metrics(
 
     # 3. Bundle Timing Consistency (0-1)
     # Analyze how consistent the timing patterns are
-    time_gaps = []
-    sorted_clusters = sorted(bundle_clusters, key=lambda x: x.first_unix)
-    for i in range(1, len(sorted_clusters)):
-        gap = sorted_clusters[i].first_unix - sorted_clusters[i-1].first_unix
-        time_gaps.append(gap)
+    time_gaps = cluster_start_gaps(bundle_clusters)
 
     if time_gaps:
         timing_cv = coefficient_of_variation(time_gaps)
@@ -625,22 +980,24 @@ def calculate_bundle_risk_metrics(
     analysis_window = min(300, len(transactions))  # Analyze up to first 300
     early_txs = transactions[:analysis_window]
 
-    # Track which transactions are bundled (by index to avoid double counting)
-    bundled_indices = set()
-
-    for i, tx in enumerate(early_txs):
+    # Cluster windows sorted by start, with the furthest end reached so far, so
+    # a binary search finds whether any window covers a given time
+    window_starts = []
+    window_reach = []
+    furthest_end = float("-inf")
+    for cluster in sorted(bundle_clusters, key=lambda x: x.first_unix):
+        furthest_end = max(furthest_end, cluster.first_unix + cluster.window_seconds)
+        window_starts.append(cluster.first_unix)
+        window_reach.append(furthest_end)
+
+    # Count transactions inside any bundle cluster time window (each counted once)
+    early_bundled_count = 0
+    for tx in early_txs:
         tx_time = tx.get("block_unix_time", 0)
+        idx = bisect_right(window_starts, tx_time) - 1
+        if idx >= 0 and tx_time <= window_reach[idx]:
+            early_bundled_count += 1
 
-        # Check if this transaction falls within any bundle cluster time window
-        for cluster in bundle_clusters:
-            cluster_start = cluster.first_unix
-            cluster_end = cluster_start + cluster.window_seconds
-
-            if cluster_start <= tx_time <= cluster_end:
-                bundled_indices.add(i)
-                break  # Don't count same transaction in multiple clusters
-
-    early_bundled_count = len(bundled_indices)
     early_dominance = (early_bundled_count / len(early_txs)) * 100 if early_txs else 0.0
 
     # 5. Coordination Sophistication
@@ -670,20 +1027,23 @@ async def analyze_present_impact(
     # Extract all unique wallets that participated in bundles
     bundled_wallets = set()
     bundle_wallet_initial_buys = {}  # Track initial buy amounts
+    wallet_bundle_count = {}  # Appearances per wallet across bundle samples
 
+    tx_by_hash = index_sample_transactions(bundle_clusters, transactions)
     for cluster in bundle_clusters:
         for tx_hash in cluster.sample_txs:
-            for tx in transactions:
-                if tx.get("tx_hash") == tx_hash:
-                    wallet = tx.get("owner", "")
-                    if wallet:
-                        bundled_wallets.add(wallet)
-                        # Track initial buy amount
-                        to_data = tx.get("to", {})
-                        if isinstance(to_data, dict):
-                            amount = safe_float(to_data.get("ui_amount", 0))
-                            bundle_wallet_initial_buys[wallet] = bundle_wallet_initial_buys.get(wallet, 0) + amount
-                    break
+            tx = tx_by_hash.get(tx_hash)
+            if tx is None:
+                continue
+            wallet = tx.get("owner", "")
+            if wallet:
+                bundled_wallets.add(wallet)
+                wallet_bundle_count[wallet] = wallet_bundle_count.get(wallet, 0) + 1
+                # Track initial buy amount
+                to_data = tx.get("to", {})
+                if isinstance(to_data, dict):
+                    amount = safe_float(to_data.get("ui_amount", 0))
+                    bundle_wallet_initial_buys[wallet] = bundle_wallet_initial_buys.get(wallet, 0) + amount
 
     if not bundled_wallets:
         return None
@@ -724,16 +1084,6 @@ async def analyze_present_impact(
         # No points for 3 or fewer clusters
 
         # Factor 2: Wallet reuse across bundles (30 points max)
-        wallet_bundle_count = {}
-        for cluster in bundle_clusters:
-            for tx_hash in cluster.sample_txs:
-                for tx in transactions:
-                    if tx.get("tx_hash") == tx_hash:
-                        wallet = tx.get("owner", "")
-                        if wallet:
-                            wallet_bundle_count[wallet] = wallet_bundle_count.get(wallet, 0) + 1
-                        break
-
         multi_bundle_wallets = sum(1 for count in wallet_bundle_count.values() if count > 1)
         if multi_bundle_wallets > len(bundled_wallets) * 0.5:
             risk_score += 30
@@ -764,12 +1114,7 @@ async def analyze_present_impact(
 
         # Factor 4: Timing coordination (10 points max)
         if bundle_count > 5:
-            time_gaps = []
-            sorted_clusters = sorted(bundle_clusters, key=lambda x: x.first_unix)
-            for i in range(1, len(sorted_clusters)):
-                gap = sorted_clusters[i].first_unix - sorted_clusters[i-1].first_unix
-                time_gaps.append(gap)
-
+            time_gaps = cluster_start_gaps(bundle_clusters)
             if time_gaps:
                 avg_gap = sum(time_gaps) / len(time_gaps)
                 if avg_gap < 10:  # Very rapid succession
@@ -865,18 +1210,7 @@ async def analyze_present_impact(
             }
 
     except Exception as e:
-        # Fallback to pattern-only analysis if there's any error
-        pattern_risk_score, pattern_risk_factors = calculate_bundle_pattern_risk()
-
-        if pattern_risk_score >= 80:
-            pattern_risk_level = "CRITICAL"
-        elif pattern_risk_score >= 60:
-            pattern_risk_level = "HIGH"
-        elif pattern_risk_score >= 35:
-            pattern_risk_level = "MEDIUM"
-        else:
-            pattern_risk_level = "LOW"
-
+        # Fallback to the pattern-only analysis computed above if there's any error
         return {
             "bundled_wallets_count": len(bundled_wallets),
             "total_initial_tokens_bought": round(sum(bundle_wallet_initial_buys.values()), 2),
@@ -912,26 +1246,34 @@ def detect_bundles(
     if not transactions:
         return False, [], 0.0
 
-    # Extract and sort all buy transactions by timestamp
+    # Extract buy transactions, reading the fields used below once per
+    # transaction into (timestamp, wallet, volume_usd, tokens_received, tx_hash)
     buy_txs = []
     for tx in transactions:
         tx_type = tx.get("tx_type") or tx.get("side", "")
         if tx_type == "buy":
-            buy_txs.append(tx)
+            to_data = tx.get("to", {})
+            buy_txs.append((
+                tx.get("block_unix_time") or tx.get("blockUnixTime", 0),
+                tx.get("owner") or tx.get("user") or tx.get("wallet", ""),
+                safe_float(tx.get("volume_usd") or tx.get("volumeUsd", 0)),
+                safe_float(to_data.get("ui_amount", 0)) if isinstance(to_data, dict) else 0.0,
+                tx.get("tx_hash") or tx.get("txHash", ""),
+            ))
 
     if not buy_txs:
         return False, [], 0.0
 
     # Sort by timestamp ascending
-    buy_txs.sort(key=lambda x: x.get("block_unix_time") or x.get("blockUnixTime", 0))
+    buy_txs.sort(key=itemgetter(0))
 
     # Determine effective launch time (for reference/logging only)
-    earliest_tx_time = buy_txs[0].get("block_unix_time") or buy_txs[0].get("blockUnixTime", 0)
+    earliest_tx_time = buy_txs[0][0]
 
     # If creation_ts is far in the future or past compared to transactions, use earliest transaction
     if creation_ts and abs(creation_ts - earliest_tx_time) > 86400:  # More than 1 day difference
         effective_launch_time = earliest_tx_time
-        print(f"⚠️  Using earliest transaction time as launch reference (creation_ts seems unreliable)")
+        logger.warning("⚠️  Using earliest transaction time as launch reference (creation_ts seems unreliable)")
     elif creation_ts:
         effective_launch_time = creation_ts
     else:
@@ -941,83 +1283,88 @@ def detect_bundles(
     # This ensures we analyze the full early trading window regardless of how fast trading was
     txs_to_analyze = buy_txs
     
-    print(f"🔍 Analyzing {len(txs_to_analyze)} transactions from launch (no time filtering)")
+    logger.info("🔍 Analyzing %d transactions from launch (no time filtering)", len(txs_to_analyze))
 
     if not txs_to_analyze:
         return False, [], 0.0
 
     bundles = []
     n = len(txs_to_analyze)
-    i = 0
-
-    while i < n:
+    times = [tx[0] for tx in txs_to_analyze]
+
+    # Sliding window: starts only move forward, so the window end pointer j
+    # never moves back and the whole scan is linear. Wallet counts for the
+    # current window are updated as transactions enter and leave it.
+    j = 0
+    wallet_counts: Dict[str, int] = {}
+    wallet_txs = 0
+    for i in range(n):
         # Define window based on first transaction
-        start_time = txs_to_analyze[i].get("block_unix_time") or txs_to_analyze[i].get("blockUnixTime", 0)
+        start_time = times[i]
         window_end = start_time + window_seconds
 
-        # Collect all transactions within window
-        j = i
-        while j < n:
-            tx_time = txs_to_analyze[j].get("block_unix_time") or txs_to_analyze[j].get("blockUnixTime", 0)
-            if tx_time <= window_end:
-                j += 1
-            else:
-                break
+        # Extend the window to all transactions within window_end
+        j = max(j, i)
+        while j < n and times[j] <= window_end:
+            wallet = txs_to_analyze[j][1]
+            if wallet:
+                wallet_counts[wallet] = wallet_counts.get(wallet, 0) + 1
+                wallet_txs += 1
+            j += 1
 
-        window_txs = txs_to_analyze[i:j]
+        window_size = j - i
 
         # Check if this qualifies as a cluster (minimum size check only)
-        if len(window_txs) >= min_trades_in_cluster:
-            # Extract wallet addresses
-            wallets = []
-            for tx in window_txs:
-                wallet = tx.get("owner") or tx.get("user") or tx.get("wallet", "")
-                if wallet:
-                    wallets.append(wallet)
-
+        if window_size >= min_trades_in_cluster:
             # Calculate wallet diversity
-            unique_wallets = len(set(wallets))
-            wallet_diversity = unique_wallets / len(wallets) if wallets else 1.0
-
-            # Calculate volumes for coherence check
-            volumes = []
-            for tx in window_txs:
-                vol = safe_float(tx.get("volume_usd") or tx.get("volumeUsd", 0))
-                if vol > 0:
-                    volumes.append(vol)
-
-            # Calculate price/volume coefficient of variation
-            price_cv = coefficient_of_variation(volumes) if volumes else 0
-
-            # Calculate bundle score (0-1 scale) - following reference implementation
-            score = (
-                0.5 * max(0, 1 - (len(window_txs) / min_trades_in_cluster - 1))
+            unique_wallets = len(wallet_counts)
+            wallet_diversity = unique_wallets / wallet_txs if wallet_txs else 1.0
+
+            # Size and wallet terms of the bundle score (0-1 scale) - following
+            # reference implementation; the volume term adds at most 0.2
+            partial_score = (
+                0.5 * max(0, 1 - (window_size / min_trades_in_cluster - 1))
                 + 0.3 * max(0, 1 - wallet_diversity / max_wallet_diversity)
-                + 0.2 * max(0, 1 - price_cv / 0.2)
             )
 
-            # Get sample transaction hashes
-            sample_txs = []
-            for tx in window_txs[:5]:  # Max 5 samples
-                tx_hash = tx.get("tx_hash") or tx.get("txHash", "")
-                if tx_hash:
-                    sample_txs.append(tx_hash)
-
-            # Create bundle cluster object - collect ALL clusters regardless of diversity
-            cluster = BundleCluster(
-                cluster_size=len(window_txs),
-                window_seconds=window_seconds,
-                unique_wallets=unique_wallets,
-                wallet_diversity_ratio=round(wallet_diversity, 3),
-                score=round(score, 3),
-                sample_txs=sample_txs,
-                first_unix=start_time
-            )
+            # Only windows that can pass the filter below are scored: those
+            # within the diversity limit, or able to reach a 0.5 score
+            if (round(wallet_diversity, 3) <= max_wallet_diversity
+                    or round(partial_score + 0.2, 3) >= 0.5):
+                window_txs = txs_to_analyze[i:j]
+
+                # Calculate volumes for coherence check
+                volumes = [tx[2] for tx in window_txs if tx[2] > 0]
+
+                # Calculate price/volume coefficient of variation
+                price_cv = coefficient_of_variation(volumes) if volumes else 0
+
+                score = partial_score + 0.2 * max(0, 1 - price_cv / 0.2)
 
-            bundles.append(cluster)
+                # Get sample transaction hashes
+                sample_txs = [tx[4] for tx in window_txs[:5] if tx[4]]  # Max 5 samples
 
-        # Move to next transaction
-        i += 1
+                # Create bundle cluster object
+                cluster = BundleCluster(
+                    cluster_size=window_size,
+                    window_seconds=window_seconds,
+                    unique_wallets=unique_wallets,
+                    wallet_diversity_ratio=round(wallet_diversity, 3),
+                    score=round(score, 3),
+                    sample_txs=sample_txs,
+                    first_unix=start_time
+                )
+
+                bundles.append(cluster)
+
+        # Drop the window's first transaction before the next start
+        wallet = txs_to_analyze[i][1]
+        if j > i and wallet:
+            wallet_txs -= 1
+            if wallet_counts[wallet] == 1:
+                del wallet_counts[wallet]
+            else:
+                wallet_counts[wallet] -= 1
 
     # Filter bundles based on criteria (following reference approach)
     # Keep clusters that meet diversity criteria OR have high scores
@@ -1026,128 +1373,113 @@ def detect_bundles(
         if bundle.wallet_diversity_ratio <= max_wallet_diversity or bundle.score >= 0.5:
             valid_bundles.append(bundle)
 
-    # Calculate total tokens bundled from all valid bundles
+    # Calculate total tokens bundled from all valid bundles, counting each
+    # transaction once. Bundles are in start order with equal-length windows,
+    # so their index ranges only grow and `covered` marks what is summed.
     total_bundled_tokens = 0.0
-    processed_indices = set()
+    covered = 0
 
     for bundle in valid_bundles:
-        # Find transactions that belong to this bundle
+        # Transactions that belong to this bundle form a contiguous time range
         start_time = bundle.first_unix
         end_time = start_time + bundle.window_seconds
+        lo = max(bisect_left(times, start_time), covered)
+        hi = bisect_right(times, end_time)
 
-        for idx, tx in enumerate(txs_to_analyze):
-            tx_time = tx.get("block_unix_time") or tx.get("blockUnixTime", 0)
-            if start_time <= tx_time <= end_time and idx not in processed_indices:
-                # Extract token amount from 'to' field (tokens received)
-                to_data = tx.get("to", {})
-                if isinstance(to_data, dict):
-                    ui_amount = safe_float(to_data.get("ui_amount", 0))
-                    total_bundled_tokens += ui_amount
-                    processed_indices.add(idx)
+        for tx in txs_to_analyze[lo:hi]:
+            # Token amount from the 'to' field (tokens received)
+            total_bundled_tokens += tx[3]
+        covered = max(covered, hi)
 
     return (len(valid_bundles) > 0), valid_bundles, total_bundled_tokens
 
 
+# EVM addresses are 0x followed by 40 hex digits
+EVM_ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
 def detect_chain(address: str) -> str:
     """Auto-detect chain based on address format"""
-    if address.startswith("0x") and len(address) == 42:
+    if EVM_ADDRESS_PATTERN.fullmatch(address):
         return "base"  # Default EVM chain for 0x addresses
-    elif len(address) in [32, 43, 44] and address.isalnum():
-        return "solana"
-    else:
-        # Default to solana for other formats
-        return "solana"
+    # Default to solana for everything else
+    return "solana"
+
+
+@retry_network_errors()
+async def _get_birdeye_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: Dict[str, str],
+    params: Dict[str, Any],
+    label: str
+) -> Dict[str, Any]:
+    """GET a BirdEye endpoint and return its JSON body, raising on non-200 responses"""
+    async with birdeye_limiter, session.get(url, headers=headers, params=params, timeout=30) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            raise Exception(f"BirdEye {label} API error: {response.status} - {error_text}")
+        return orjson.loads(await response.read())
 
 
 async def fetch_birdeye_market_data(chain: str, token_address: str) -> TokenMarketData:
     """Fetch comprehensive market data from BirdEye API"""
 
-    api_key = os.getenv("BIRDEYE_API_KEY")
-    if not api_key:
+    if not BIRDEYE_API_KEY:
         raise Exception("BIRDEYE_API_KEY not found in environment variables. Please set it in your .env file")
 
-    # Map our chain names to BirdEye's expected values
-    chain_map = {
-        "solana": "solana",
-        "ethereum": "ethereum",
-        "base": "base",
-        "bnb": "bsc",
-        "shibarium": "shibarium",
-    }
-
-    birdeye_chain = chain_map.get(chain.lower(), chain.lower())
+    birdeye_chain = BIRDEYE_CHAIN_MAP.get(chain.lower(), chain.lower())
 
-    print(f"🦅 Fetching market data from BirdEye for {token_address} on {birdeye_chain}")
+    cache_key = (birdeye_chain, token_address)
+    cached_market_data = market_data_cache.get(cache_key)
+    if cached_market_data is not None:
+        return cached_market_data
 
-    base_url = "https://public-api.birdeye.so"
-    headers = {
-        "X-API-KEY": api_key,
-        "x-chain": birdeye_chain,
-        "Accept": "application/json"
-    }
+    logger.info("🦅 Fetching market data from BirdEye for %s on %s", token_address, birdeye_chain)
 
-    async with aiohttp.ClientSession() as session:
-        # Fetch token metadata for name and symbol
-        metadata_url = f"{base_url}/defi/v3/token/meta-data/single"
-        params = {"address": token_address}
+    base_url = BIRDEYE_BASE_URL
+    headers = birdeye_headers(birdeye_chain)
 
-        async with session.get(metadata_url, headers=headers, params=params, timeout=30) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise Exception(f"BirdEye meta-data API error: {response.status} - {error_text}")
-
-            metadata_response = await response.json()
-
-        # Fetch basic market data
-        market_url = f"{base_url}/defi/v3/token/market-data"
-
-        async with session.get(market_url, headers=headers, params=params, timeout=30) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise Exception(f"BirdEye market-data API error: {response.status} - {error_text}")
-
-            market_data = await response.json()
-
-        # Fetch trade data for volume and price changes
-        trade_url = f"{base_url}/defi/v3/token/trade-data/single"
-
-        async with session.get(trade_url, headers=headers, params=params, timeout=30) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise Exception(f"BirdEye trade-data API error: {response.status} - {error_text}")
-
-            trade_data = await response.json()
+    params = {"address": token_address}
+    ohlcv_params = {
+        "address": token_address,
+        "type": "5m",  # 5-minute timeframe
+        "limit": 1  # Get latest candle only
+    }
 
-        # Fetch 5-minute OHLCV data
-        ohlcv_url = f"{base_url}/defi/ohlcv"
-        ohlcv_params = {
-            "address": token_address,
-            "type": "5m",  # 5-minute timeframe
-            "limit": 1  # Get latest candle only
-        }
+    session = await get_session()
+    # Metadata (name/symbol), market data, trade data (volume and price
+    # changes) and the latest 5-minute candle are independent - fetch together
+    metadata_response, market_data, trade_data, ohlcv_response = await asyncio.gather(
+        _get_birdeye_json(session, f"{base_url}/defi/v3/token/meta-data/single", headers, params, "meta-data"),
+        _get_birdeye_json(session, f"{base_url}/defi/v3/token/market-data", headers, params, "market-data"),
+        _get_birdeye_json(session, f"{base_url}/defi/v3/token/trade-data/single", headers, params, "trade-data"),
+        _get_birdeye_json(session, f"{base_url}/defi/ohlcv", headers, ohlcv_params, "OHLCV"),
+        return_exceptions=True
+    )
 
-        ohlcv_data = None
-        try:
-            async with session.get(ohlcv_url, headers=headers, params=ohlcv_params, timeout=30) as response:
-                if response.status == 200:
-                    ohlcv_response = await response.json()
-                    if ohlcv_response.get("success") and ohlcv_response.get("data"):
-                        items = ohlcv_response["data"].get("items", [])
-                        if items:
-                            # Get the latest 5-minute candle
-                            latest_candle = items[0]
-                            ohlcv_data = {
-                                "timestamp": latest_candle.get("timestamp"),
-                                "open": safe_float(latest_candle.get("open")),
-                                "high": safe_float(latest_candle.get("high")),
-                                "low": safe_float(latest_candle.get("low")),
-                                "close": safe_float(latest_candle.get("close")),
-                                "volume": safe_float(latest_candle.get("volume"))
-                            }
-                else:
-                    print(f"⚠️  OHLCV data not available: {response.status}")
-        except Exception as e:
-            print(f"⚠️  Failed to fetch OHLCV data: {str(e)}")
+    # The first three are required; raise in the order they used to be fetched
+    for response in (metadata_response, market_data, trade_data):
+        if isinstance(response, BaseException):
+            raise response
+
+    # OHLCV is optional
+    ohlcv_data = None
+    if isinstance(ohlcv_response, BaseException):
+        logger.warning("⚠️  Failed to fetch OHLCV data: %s", ohlcv_response)
+    elif ohlcv_response.get("success") and ohlcv_response.get("data"):
+        items = ohlcv_response["data"].get("items", [])
+        if items:
+            # Get the latest 5-minute candle
+            latest_candle = items[0]
+            ohlcv_data = {
+                "timestamp": latest_candle.get("timestamp"),
+                "open": safe_float(latest_candle.get("open")),
+                "high": safe_float(latest_candle.get("high")),
+                "low": safe_float(latest_candle.get("low")),
+                "close": safe_float(latest_candle.get("close")),
+                "volume": safe_float(latest_candle.get("volume"))
+            }
 
     # Extract data from responses
     metadata_info = metadata_response.get("data", {})
@@ -1171,13 +1503,21 @@ async def fetch_birdeye_market_data(chain: str, token_address: str) -> TokenMark
     token_symbol = metadata_info.get("symbol", "Unknown")
     token_name = metadata_info.get("name", token_symbol)
 
-    print(f"✅ Successfully fetched BirdEye data for {token_symbol} (${price_usd:.6f})")
-    print(f"   Volume 24h: ${volume_24h_usd:,.2f}")
-    print(f"   Liquidity: ${liquidity_usd:,.2f}")
-    if ohlcv_data:
-        print(f"   OHLCV (5m): O:{ohlcv_data['open']:.6f} H:{ohlcv_data['high']:.6f} L:{ohlcv_data['low']:.6f} C:{ohlcv_data['close']:.6f}")
+    # Thousands separators need format(), so only build the summary when it is logged
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("✅ Successfully fetched BirdEye data for %s ($%.6f)", token_symbol, price_usd)
+        logger.info("   Volume 24h: $%s", format(volume_24h_usd, ",.2f"))
+        logger.info("   Liquidity: $%s", format(liquidity_usd, ",.2f"))
+        if ohlcv_data:
+            logger.info(
+                "   OHLCV (5m): O:%.6f H:%.6f L:%.6f C:%.6f",
+                ohlcv_data["open"],
+                ohlcv_data["high"],
+                ohlcv_data["low"],
+                ohlcv_data["close"]
+            )
 
-    return TokenMarketData(
+    token_market_data = TokenMarketData(
         price_usd=price_usd,
         fdv_usd=fdv_usd,
         market_cap_usd=market_cap_usd,
@@ -1189,6 +1529,8 @@ async def fetch_birdeye_market_data(chain: str, token_address: str) -> TokenMark
         token_name=token_name,
         ohlcv_5m=ohlcv_data
     )
+    market_data_cache[cache_key] = token_market_data
+    return token_market_data
 
 
 async def fetch_moralis_holder_data(
@@ -1198,137 +1540,168 @@ async def fetch_moralis_holder_data(
 
     # Skip Moralis for Shibarium as specified
     if chain.lower() == "shibarium":
-        print("⚠️  Skipping holder data for Shibarium (not supported by Moralis)")
+        logger.info("⚠️  Skipping holder data for Shibarium (not supported by Moralis)")
         return None
 
-    api_key = os.getenv("MORALIS_API_KEY")
-    if not api_key:
-        print("⚠️  MORALIS_API_KEY not set - skipping holder data")
+    if not MORALIS_API_KEY:
+        logger.warning("⚠️  MORALIS_API_KEY not set - skipping holder data")
         return None
 
-    # Map chains to Moralis chain names
-    chain_map = {
-        "ethereum": "eth",
-        "base": "base",
-        "bnb": "bsc",
-        "bsc": "bsc",  # Support both "bnb" and "bsc" as input
-    }
+    cache_key = (chain.lower(), token_address)
+    cached_holder_data = holder_data_cache.get(cache_key)
+    if cached_holder_data is not None:
+        return cached_holder_data
 
     # For Solana, use Solana gateway endpoint
     if chain.lower() == "solana":
         url = f"https://solana-gateway.moralis.io/token/mainnet/holders/{token_address}"
-        headers = {
-            "X-API-Key": api_key,
-            "Accept": "application/json",
-        }
+        headers = MORALIS_HEADERS
         params = None
     else:
         # EVM chains
-        chain_name = chain_map.get(chain.lower())
+        chain_name = MORALIS_CHAIN_MAP.get(chain.lower())
         if not chain_name:
-            print(f"⚠️  Chain {chain} not supported by Moralis")
+            logger.warning("⚠️  Chain %s not supported by Moralis", chain)
             return None
 
         url = f"https://deep-index.moralis.io/api/v2.2/erc20/{token_address}/holders"
-        headers = {
-            "X-API-Key": api_key,
-            "Accept": "application/json",
-        }
+        headers = MORALIS_HEADERS
         params = {"chain": chain_name}
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(
-                url,
-                headers=headers,
-                params=params,
-                timeout=30,
-            ) as response:
-                if response.status != 200:
-                    print(f"⚠️  Moralis API error: {response.status}")
-                    return None
+    if not moralis_breaker.allow_request():
+        logger.warning("⚠️  Moralis circuit open - skipping holder data")
+        return None
 
-                data = await response.json()
+    session = await get_session()
+    try:
+        async with session.get(
+            url,
+            headers=headers,
+            params=params,
+            timeout=30,
+        ) as response:
+            moralis_breaker.record_response(response.status)
+            if response.status != 200:
+                logger.warning("⚠️  Moralis API error: %s", response.status)
+                return None
 
-                # Handle null response
-                if data is None:
-                    print(f"⚠️  No holder data available for this token")
-                    return None
+            data = orjson.loads(await response.read())
 
-                # Extract metrics from new Moralis API response structure
-                total_holders = data.get("totalHolders", 0)
+            # Handle null response
+            if data is None:
+                logger.info("⚠️  No holder data available for this token")
+                return None
 
-                # Get top 10 concentration from holderSupply.top10.supplyPercent
-                holder_supply = data.get("holderSupply", {})
-                top10_info = holder_supply.get("top10", {})
-                top10_concentration = top10_info.get("supplyPercent", 0)
+            # Extract metrics from new Moralis API response structure
+            total_holders = data.get("totalHolders", 0)
 
-                # Get 24h holder change
-                holder_change = data.get("holderChange", {})
-                holder_change_24h = holder_change.get("24h", {}).get("change", None)
+            # Get top 10 concentration from holderSupply.top10.supplyPercent
+            holder_supply = data.get("holderSupply", {})
+            top10_info = holder_supply.get("top10", {})
+            top10_concentration = top10_info.get("supplyPercent", 0)
 
-                return TokenHolderData(
-                    total_holders=total_holders,
-                    top10_concentration=top10_concentration,
-                    holder_change_24h=holder_change_24h,
-                    chain=chain,
-                )
+            # Get 24h holder change
+            holder_change = data.get("holderChange", {})
+            holder_change_24h = holder_change.get("24h", {}).get("change", None)
 
-        except Exception as e:
-            print(f"❌ Failed to fetch holder data from Moralis: {str(e)}")
-            return None
+            holder_data = TokenHolderData(
+                total_holders=total_holders,
+                top10_concentration=top10_concentration,
+                holder_change_24h=holder_change_24h,
+                chain=chain,
+            )
+            holder_data_cache[cache_key] = holder_data
+            return holder_data
 
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        moralis_breaker.record_failure()
+        logger.error("❌ Failed to fetch holder data from Moralis: %s", str(e) or type(e).__name__)
+        return None
+    except Exception as e:
+        logger.error("❌ Failed to fetch holder data from Moralis: %s", e)
+        return None
 
+
+async def fetch_moralis_holder_data_bulk(
+    chain: str,
+    token_addresses: List[str],
+    max_concurrent: int = 10
+) -> Dict[str, Optional[TokenHolderData]]:
+    """
+    Fetch holder statistics for many tokens on one chain concurrently.
+
+    Moralis has no multi-token holders endpoint, so each token is a separate
+    request through fetch_moralis_holder_data; results land in
+    holder_data_cache, so later single-token lookups are served from it.
+
+    Args:
+        chain: Blockchain name
+        token_addresses: Token contract addresses (duplicates are fetched once)
+        max_concurrent: Maximum number of requests in flight at once
+
+    Returns:
+        Dictionary mapping token address to its holder data (None if unavailable)
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    unique_addresses = list(dict.fromkeys(token_addresses))
+
+    async def fetch_one(token_address):
+        async with semaphore:
+            return await fetch_moralis_holder_data(chain, token_address)
+
+    results = await asyncio.gather(*(fetch_one(address) for address in unique_addresses))
+    return dict(zip(unique_addresses, results))
+
+
+@retry_network_errors()
 async def fetch_token_creation_info(token_address: str) -> Optional[CreationInfo]:
     """Fetch token creation information from BirdEye API"""
 
-    api_key = os.getenv("BIRDEYE_API_KEY")
-    if not api_key:
+    if not BIRDEYE_API_KEY:
         raise Exception("BIRDEYE_API_KEY not found in environment variables")
 
-    base_url = "https://public-api.birdeye.so"
-    headers = {
-        "X-API-KEY": api_key,
-        "x-chain": "solana",  # Bundler is Solana-only
-        "Accept": "application/json"
-    }
+    base_url = BIRDEYE_BASE_URL
+    headers = birdeye_headers("solana")  # Bundler is Solana-only
 
     url = f"{base_url}/defi/token_creation_info"
     params = {"address": token_address}
 
-    print(f"🦅 Fetching creation info for {token_address}")
+    cached_creation_info = creation_info_cache.get(token_address)
+    if cached_creation_info is not None:
+        return cached_creation_info
 
-    async with aiohttp.ClientSession() as session:
-        # Add rate limiting sleep
-        await asyncio.sleep(0.2)  # 5 RPS limit
+    logger.info("🦅 Fetching creation info for %s", token_address)
 
-        async with session.get(url, headers=headers, params=params, timeout=30) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                print(f"⚠️  Failed to fetch creation info: {response.status} - {error_text}")
-                return None
+    session = await get_session()
+    async with birdeye_limiter, session.get(url, headers=headers, params=params, timeout=30) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            logger.warning("⚠️  Failed to fetch creation info: %s - %s", response.status, error_text)
+            return None
 
-            data = await response.json()
-            creation_data = data.get("data")
+        data = orjson.loads(await response.read())
+        creation_data = data.get("data")
 
-            if not creation_data:
-                print(f"⚠️  No creation info available for {token_address}")
-                return None
+        if not creation_data:
+            logger.warning("⚠️  No creation info available for %s", token_address)
+            return None
 
-            # Extract creation info
-            block_unix_time = creation_data.get("blockUnixTime")
-            block_human_time = creation_data.get("blockHumanTime")
-            tx_hash = creation_data.get("txHash", "")
+        # Extract creation info
+        block_unix_time = creation_data.get("blockUnixTime")
+        block_human_time = creation_data.get("blockHumanTime")
+        tx_hash = creation_data.get("txHash", "")
 
-            if not block_unix_time:
-                print(f"⚠️  Missing timestamp in creation info")
-                return None
+        if not block_unix_time:
+            logger.warning("⚠️  Missing timestamp in creation info")
+            return None
 
-            return CreationInfo(
-                created_at=block_human_time or iso_timestamp(block_unix_time),
-                creation_tx=tx_hash,
-                block_unix_time=block_unix_time
-            )
+        creation_info = CreationInfo(
+            created_at=block_human_time or iso_timestamp(block_unix_time),
+            creation_tx=tx_hash,
+            block_unix_time=block_unix_time
+        )
+        creation_info_cache[token_address] = creation_info
+        return creation_info
 
 
 async def fetch_moralis_transactions(
@@ -1347,104 +1720,110 @@ async def fetch_moralis_transactions(
     Returns:
         List of transaction dictionaries in BirdEye-compatible format
     """
-    api_key = os.getenv("MORALIS_API_KEY")
-    if not api_key:
-        print("⚠️  MORALIS_API_KEY not set - skipping transaction data")
+    if not MORALIS_API_KEY:
+        logger.warning("⚠️  MORALIS_API_KEY not set - skipping transaction data")
         return []
 
-    print(f"🐺 Fetching transactions from Moralis for {token_address}")
-    print(f"   From date: {datetime.fromtimestamp(from_date)}")
-    print(f"   Target limit: {limit} transactions")
+    logger.info("🐺 Fetching transactions from Moralis for %s", token_address)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("   From date: %s", datetime.fromtimestamp(from_date))
+    logger.info("   Target limit: %s transactions", limit)
 
     base_url = "https://solana-gateway.moralis.io/token/mainnet"
-    headers = {
-        "Accept": "application/json",
-        "X-API-Key": api_key
-    }
+    headers = MORALIS_HEADERS
 
     transactions = []
     cursor = None
 
-    async with aiohttp.ClientSession() as session:
-        while len(transactions) < limit:
-            # Calculate optimal page size (don't fetch more than needed)
-            remaining = limit - len(transactions)
-            page_size = min(25, remaining)  # Moralis max is 25 per page
-            url = f"{base_url}/{token_address}/swaps"
-            params = {
-                "fromDate": from_date,
-                "order": "ASC",
-                "transactionTypes": "buy",
-                "limit": page_size
-            }
+    session = await get_session()
+    while len(transactions) < limit:
+        # Calculate optimal page size (don't fetch more than needed)
+        remaining = limit - len(transactions)
+        page_size = min(25, remaining)  # Moralis max is 25 per page
+        url = f"{base_url}/{token_address}/swaps"
+        params = {
+            "fromDate": from_date,
+            "order": "ASC",
+            "transactionTypes": "buy",
+            "limit": page_size
+        }
+
+        if cursor:
+            params["cursor"] = cursor
+
+        if not moralis_breaker.allow_request():
+            logger.warning("⚠️  Moralis circuit open - stopping transaction fetch")
+            break
+
+        try:
+            async with moralis_limiter, session.get(url, headers=headers, params=params, timeout=30) as response:
+                moralis_breaker.record_response(response.status)
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.warning("⚠️  Moralis API error: %s - %s", response.status, error_text)
+                    break
+
+                data = orjson.loads(await response.read())
+                result = data.get("result", [])
+
+                if not result:
+                    break
 
-            if cursor:
-                params["cursor"] = cursor
-
-            # Add rate limiting
-            await asyncio.sleep(0.2)
-
-            try:
-                async with session.get(url, headers=headers, params=params, timeout=30) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        print(f"⚠️  Moralis API error: {response.status} - {error_text}")
-                        break
-
-                    data = await response.json()
-                    result = data.get("result", [])
-
-                    if not result:
-                        break
-
-                    # Convert Moralis format to BirdEye-compatible format
-                    converted_txs = []
-                    for tx in result:
-                        try:
-                            # Convert timestamp to unix
-                            block_time_str = tx.get("blockTimestamp", "")
-                            block_unix_time = int(datetime.fromisoformat(block_time_str.replace('Z', '+00:00')).timestamp())
-
-                            # Extract bought token info
-                            bought = tx.get("bought", {})
-                            sold = tx.get("sold", {})
-
-                            converted_tx = {
-                                "tx_type": "buy",
-                                "tx_hash": tx.get("transactionHash", ""),
-                                "block_unix_time": block_unix_time,
-                                "block_number": tx.get("blockNumber", 0),
-                                "owner": tx.get("walletAddress", ""),
-                                "to": {
-                                    "address": bought.get("address", ""),
-                                    "symbol": bought.get("symbol", ""),
-                                    "ui_amount": float(bought.get("amount", 0))
-                                },
-                                "from": {
-                                    "address": sold.get("address", ""),
-                                    "symbol": sold.get("symbol", ""),
-                                    "ui_amount": float(sold.get("amount", 0))
-                                }
+                # Convert Moralis format to BirdEye-compatible format
+                converted_txs = []
+                for tx in result:
+                    try:
+                        # Convert timestamp to unix
+                        block_time_str = tx.get("blockTimestamp", "")
+                        block_unix_time = int(datetime.fromisoformat(block_time_str.replace('Z', '+00:00')).timestamp())
+
+                        # Extract bought token info
+                        bought = tx.get("bought", {})
+                        sold = tx.get("sold", {})
+
+                        converted_tx = {
+                            "tx_type": "buy",
+                            "tx_hash": tx.get("transactionHash", ""),
+                            "block_unix_time": block_unix_time,
+                            "block_number": tx.get("blockNumber", 0),
+                            # Interned so the wallet set/dict lookups in bundle
+                            # analysis match on identity instead of comparing bytes
+                            "owner": sys.intern(tx.get("walletAddress") or ""),
+                            "to": {
+                                "address": bought.get("address", ""),
+                                "symbol": bought.get("symbol", ""),
+                                "ui_amount": float(bought.get("amount", 0))
+                            },
+                            "from": {
+                                "address": sold.get("address", ""),
+                                "symbol": sold.get("symbol", ""),
+                                "ui_amount": float(sold.get("amount", 0))
                             }
-                            converted_txs.append(converted_tx)
-                        except Exception as e:
-                            print(f"⚠️  Error converting transaction: {str(e)}")
-                            continue
-
-                    transactions.extend(converted_txs)
-                    print(f"   Page fetched: {len(converted_txs)} transactions (total: {len(transactions)})")
-
-                    # Check if there are more pages
-                    cursor = data.get("cursor")
-                    if not cursor or len(result) < page_size:
-                        print(f"   Pagination complete: {'no more cursor' if not cursor else 'partial page received'}")
-                        break
-
-            except Exception as e:
-                print(f"❌ Error fetching from Moralis: {str(e)}")
-                break
+                        }
+                        converted_txs.append(converted_tx)
+                    except (ValueError, TypeError, AttributeError) as e:
+                        # Malformed swap (missing timestamp, null amounts); skip it
+                        logger.warning("⚠️  Error converting transaction: %s", e)
+                        continue
+
+                transactions.extend(converted_txs)
+                logger.info("   Page fetched: %d transactions (total: %d)", len(converted_txs), len(transactions))
+
+                # Check if there are more pages
+                cursor = data.get("cursor")
+                if not cursor or len(result) < page_size:
+                    logger.info("   Pagination complete: %s", "no more cursor" if not cursor else "partial page received")
+                    break
 
-    print(f"✅ Fetched {len(transactions)} buy transactions from Moralis")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            moralis_breaker.record_failure()
+            logger.error("❌ Error fetching from Moralis: %s", str(e) or type(e).__name__)
+            break
+        except Exception as e:
+            logger.error("❌ Error fetching from Moralis: %s", e)
+            break
+
+    logger.info("✅ Fetched %d buy transactions from Moralis", len(transactions))
     return transactions[:limit]
 
 
@@ -1467,79 +1846,88 @@ async def fetch_token_transactions(
         before_time: Unix timestamp - fetch transactions before this time
     """
 
-    api_key = os.getenv("BIRDEYE_API_KEY")
-    if not api_key:
+    if not BIRDEYE_API_KEY:
         raise Exception("BIRDEYE_API_KEY not found in environment variables")
 
-    base_url = "https://public-api.birdeye.so"
-    headers = {
-        "X-API-KEY": api_key,
-        "x-chain": "solana",  # Bundler is Solana-only
-        "Accept": "application/json"
-    }
+    base_url = BIRDEYE_BASE_URL
+    headers = birdeye_headers("solana")  # Bundler is Solana-only
 
-    print(f"🦅 Fetching transaction history for {token_address}")
-    if after_time or before_time:
+    logger.info("🦅 Fetching transaction history for %s", token_address)
+    if (after_time or before_time) and logger.isEnabledFor(logging.INFO):
         time_msg = []
         if after_time:
             time_msg.append(f"after {datetime.fromtimestamp(after_time).strftime('%Y-%m-%d %H:%M:%S')}")
         if before_time:
             time_msg.append(f"before {datetime.fromtimestamp(before_time).strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"   Time window: {' and '.join(time_msg)}")
+        logger.info("   Time window: %s", " and ".join(time_msg))
 
     transactions = []
+    offset = 0
+
+    session = await get_session()
+    for page in range(max_pages):
+        # Nothing left to request (also covers limit <= 0)
+        if len(transactions) >= limit:
+            break
+
+        # Request only what is still needed (BirdEye max is 100 per page)
+        page_size = min(100, limit - len(transactions))
+        url = f"{base_url}/defi/v3/token/txs"
+        params = {
+            "address": token_address,
+            "offset": offset,
+            "limit": page_size,
+            "sort_by": "block_unix_time",
+            "sort_type": "asc" if sort_ascending else "desc",
+            "tx_type": "buy",  # Only fetch buy transactions for bundle detection
+            "ui_amount_mode": "scaled"
+        }
 
-    async with aiohttp.ClientSession() as session:
-        for page in range(max_pages):
-            offset = page * 100
-            url = f"{base_url}/defi/v3/token/txs"
-            params = {
-                "address": token_address,
-                "offset": offset,
-                "limit": 100,
-                "sort_by": "block_unix_time",
-                "sort_type": "asc" if sort_ascending else "desc",
-                "tx_type": "buy",  # Only fetch buy transactions for bundle detection
-                "ui_amount_mode": "scaled"
-            }
-
-            # Add time window parameters if provided
-            if after_time:
-                params["after_time"] = after_time
-            if before_time:
-                params["before_time"] = before_time
-
-            # Add rate limiting sleep
-            await asyncio.sleep(0.2)  # 5 RPS limit
-
-            async with session.get(url, headers=headers, params=params, timeout=30) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    print(f"⚠️  Failed to fetch transactions page {page}: {response.status} - {error_text}")
-                    break
-
-                data = await response.json()
-                items = data.get("data", {}).get("items", [])
+        # Add time window parameters if provided
+        if after_time:
+            params["after_time"] = after_time
+        if before_time:
+            params["before_time"] = before_time
 
-                if not items:
-                    break
+        async with birdeye_limiter, session.get(url, headers=headers, params=params, timeout=30) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.warning("⚠️  Failed to fetch transactions page %s: %s - %s", page, response.status, error_text)
+                break
 
-                # Filter for buy transactions only
-                buy_txs = []
-                for item in items:
-                    tx_type = item.get("tx_type") or item.get("side", "")
-                    if tx_type == "buy":
-                        buy_txs.append(item)
+            data = orjson.loads(await response.read())
+            items = data.get("data", {}).get("items", [])
 
-                transactions.extend(buy_txs)
+            if not items:
+                break
+            offset += len(items)
+
+            # Pages are sorted by time, so once the last item is past the
+            # requested window the following pages are too
+            last_time = items[-1].get("block_unix_time", 0)
+            past_window = (
+                (sort_ascending and before_time and last_time > before_time)
+                or (not sort_ascending and after_time and last_time < after_time)
+            )
 
-                # Stop if we have enough or this page wasn't full
-                if len(transactions) >= limit or len(items) < 100:
-                    break
+            # Filter for buy transactions only, within the time window
+            for item in items:
+                tx_type = item.get("tx_type") or item.get("side", "")
+                if tx_type != "buy":
+                    continue
+                if past_window:
+                    tx_time = item.get("block_unix_time", 0)
+                    if (before_time and tx_time > before_time) or (after_time and tx_time < after_time):
+                        continue
+                transactions.append(item)
+
+            # Stop if we have enough, this page wasn't full, or the window is exhausted
+            if len(transactions) >= limit or len(items) < page_size or past_window:
+                break
 
     # Limit to requested amount
     transactions = transactions[:limit]
-    print(f"✅ Fetched {len(transactions)} buy transactions")
+    logger.info("✅ Fetched %d buy transactions", len(transactions))
 
     return transactions
 
@@ -1554,13 +1942,13 @@ async def fetch_bundler_analysis(token_address: str) -> Optional[BundlerAnalysis
     Returns:
         BundlerAnalysis object or None if analysis fails
     """
-    print(f"🔍 Starting bundler analysis for {token_address}")
+    logger.info("🔍 Starting bundler analysis for %s", token_address)
 
     try:
         # Step 1: Fetch token creation info
         creation_info = await fetch_token_creation_info(token_address)
         if not creation_info:
-            print(f"⚠️  Cannot perform bundler analysis: creation info unavailable")
+            logger.warning("⚠️  Cannot perform bundler analysis: creation info unavailable")
             return BundlerAnalysis(
                 bundled_detected=False,
                 bundle_cluster_count=0,
@@ -1577,14 +1965,34 @@ async def fetch_bundler_analysis(token_address: str) -> Optional[BundlerAnalysis
                 }
             )
 
-        print(f"✅ Token created at: {creation_info.created_at}")
+        logger.info("✅ Token created at: %s", creation_info.created_at)
+
+        token_age_days = (time.time() - creation_info.block_unix_time) / 86400
+        if token_age_days > BUNDLER_MAX_TOKEN_AGE_DAYS:
+            logger.info("⏭️  Skipping bundler analysis: token launched %.0f days ago", token_age_days)
+            return BundlerAnalysis(
+                bundled_detected=False,
+                bundle_cluster_count=0,
+                bundle_clusters=[],
+                creation_info=creation_info,
+                risk_metrics=None,
+                total_bundled_tokens=None,
+                present_impact_analysis=None,
+                price_action_analysis=None,
+                meta={
+                    "skipped": "token_too_old",
+                    "age_days": round(token_age_days, 1),
+                    "analysis_time": iso_timestamp(int(time.time())),
+                    "source": "BirdEye API"
+                }
+            )
 
         # Step 2: Fetch the first 300 buy transactions from launch onward
         # Use creation time as starting point, sort ascending to get earliest transactions first
         launch_time = creation_info.block_unix_time
         search_start_time = launch_time - 1  # Start 1 second before to catch exact launch
 
-        print(f"🔍 Fetching first 300 buy transactions from launch time: {datetime.fromtimestamp(launch_time)}")
+        logger.info("🔍 Fetching first 300 buy transactions from launch time: %s", datetime.fromtimestamp(launch_time))
 
         # Use Moralis for Solana transactions (supports ASC order)
         transactions = await fetch_moralis_transactions(
@@ -1593,7 +2001,7 @@ async def fetch_bundler_analysis(token_address: str) -> Optional[BundlerAnalysis
             limit=300
         )
         if not transactions:
-            print(f"⚠️  No transaction history available for bundler analysis")
+            logger.warning("⚠️  No transaction history available for bundler analysis")
             return BundlerAnalysis(
                 bundled_detected=False,
                 bundle_cluster_count=0,
@@ -1610,13 +2018,14 @@ async def fetch_bundler_analysis(token_address: str) -> Optional[BundlerAnalysis
                 }
             )
 
-        print(f"✅ Analyzing {len(transactions)} transactions for bundles")
+        logger.info("✅ Analyzing %s transactions for bundles", len(transactions))
 
         # Step 3: Detect bundles
         bundled_detected, bundle_clusters, total_bundled_tokens = detect_bundles(
             transactions,
             creation_info.block_unix_time
         )
+        cluster_count = len(bundle_clusters)
 
         # Calculate risk metrics, present impact analysis, and price action analysis
         risk_metrics = None
@@ -1624,7 +2033,7 @@ async def fetch_bundler_analysis(token_address: str) -> Optional[BundlerAnalysis
         price_action = None
 
         if bundled_detected:
-            print(f"📊 Calculating risk metrics for {len(bundle_clusters)} bundle clusters...")
+            logger.info("📊 Calculating risk metrics for %s bundle clusters...", cluster_count)
 
             # Calculate comprehensive risk metrics
             risk_metrics = calculate_bundle_risk_metrics(
@@ -1633,51 +2042,69 @@ async def fetch_bundler_analysis(token_address: str) -> Optional[BundlerAnalysis
                 len(transactions)
             )
 
-            # Analyze present-day impact of bundled wallets
-            present_impact = await analyze_present_impact(
-                bundle_clusters,
-                transactions,
-                token_address,
-                "solana"
-            )
-
             # Analyze price action for sell-off patterns (3-day window from first transaction)
-            if transactions:
+            async def fetch_price_action():
                 first_tx_time = transactions[0].get("block_unix_time", 0)
-                if first_tx_time > 0:
-                    # Get time range: from first transaction to 3 days later
-                    ohlcv_start = first_tx_time
-                    ohlcv_end = first_tx_time + (3 * 24 * 60 * 60)  # 3 days later
-
-                    # Fetch OHLCV data
-                    ohlcv_data = await fetch_ohlcv_data(
-                        token_address,
-                        ohlcv_start,
-                        ohlcv_end,
-                        timeframe="1D"  # Daily candles for 3-day window
-                    )
-
-                    if ohlcv_data:
-                        price_action = analyze_price_action_selloff(ohlcv_data, first_tx_time)
-
-            print(f"🎯 Risk Assessment:")
-            print(f"   Bundle Intensity: {risk_metrics.bundle_intensity_score}/100")
-            print(f"   Coordination Level: {risk_metrics.coordination_sophistication}")
-            print(f"   Early Trading Dominance: {risk_metrics.early_trading_dominance}% of first 300 txs")
+                if first_tx_time <= 0:
+                    return None
+
+                # Get time range: from first transaction to 3 days later
+                ohlcv_start = first_tx_time
+                ohlcv_end = first_tx_time + (3 * 24 * 60 * 60)  # 3 days later
+
+                # Fetch OHLCV data
+                ohlcv_data = await fetch_ohlcv_data(
+                    token_address,
+                    ohlcv_start,
+                    ohlcv_end,
+                    timeframe="1D"  # Daily candles for 3-day window
+                )
+
+                if not ohlcv_data:
+                    return None
+                return analyze_price_action_selloff(ohlcv_data, first_tx_time)
+
+            # Present-day impact of bundled wallets and price action are independent;
+            # a failure in either leaves that part empty instead of failing the analysis
+            present_impact, price_action = await asyncio.gather(
+                analyze_present_impact(
+                    bundle_clusters,
+                    transactions,
+                    token_address,
+                    "solana"
+                ),
+                fetch_price_action(),
+                return_exceptions=True
+            )
+            # Cancellation is not a failure of either part; let it propagate
+            for result in (present_impact, price_action):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+            if isinstance(present_impact, BaseException):
+                logger.warning("⚠️  Present impact analysis failed: %s", present_impact)
+                present_impact = None
+            if isinstance(price_action, BaseException):
+                logger.warning("⚠️  Price action analysis failed: %s", price_action)
+                price_action = None
+
+            logger.info("🎯 Risk Assessment:")
+            logger.info("   Bundle Intensity: %s/100", risk_metrics.bundle_intensity_score)
+            logger.info("   Coordination Level: %s", risk_metrics.coordination_sophistication)
+            logger.info("   Early Trading Dominance: %s%% of first 300 txs", risk_metrics.early_trading_dominance)
             if present_impact:
-                print(f"   Present Impact: {present_impact.get('current_impact_risk', 'UNKNOWN')}")
-                print(f"   Analysis Method: {present_impact.get('analysis_method', 'UNKNOWN')}")
+                logger.info("   Present Impact: %s", present_impact.get('current_impact_risk', 'UNKNOWN'))
+                logger.info("   Analysis Method: %s", present_impact.get('analysis_method', 'UNKNOWN'))
             if price_action:
-                print(f"   Price Action: {price_action.get('selloff_severity', 'UNKNOWN')} sell-off detected")
-                print(f"   Risk Mitigation: {price_action.get('risk_mitigation_factor', 'NONE')}")
+                logger.info("   Price Action: %s sell-off detected", price_action.get('selloff_severity', 'UNKNOWN'))
+                logger.info("   Risk Mitigation: %s", price_action.get('risk_mitigation_factor', 'NONE'))
         else:
-            print(f"📊 No bundles detected - calculating baseline risk metrics...")
+            logger.info("📊 No bundles detected - calculating baseline risk metrics...")
             risk_metrics = calculate_bundle_risk_metrics([], transactions, len(transactions))
 
         # Step 4: Create analysis result
         analysis = BundlerAnalysis(
             bundled_detected=bundled_detected,
-            bundle_cluster_count=len(bundle_clusters),
+            bundle_cluster_count=cluster_count,
             bundle_clusters=bundle_clusters,
             creation_info=creation_info,
             risk_metrics=risk_metrics,
@@ -1693,28 +2120,19 @@ async def fetch_bundler_analysis(token_address: str) -> Optional[BundlerAnalysis
             }
         )
 
-        if bundled_detected:
+        # The per-cluster summary is only built when it will be logged
+        if bundled_detected and logger.isEnabledFor(logging.INFO):
             total_bundled_txs = sum(cluster.cluster_size for cluster in bundle_clusters)
-            print(f"🚨 Bundle detected! {len(bundle_clusters)} clusters with {total_bundled_txs} total transactions")
+            logger.info("🚨 Bundle detected! %s clusters with %s total transactions", cluster_count, total_bundled_txs)
             for i, cluster in enumerate(bundle_clusters):
-                print(f"   Cluster {i+1}: {cluster.cluster_size} txs, {cluster.unique_wallets} wallets, score: {cluster.score}")
-        else:
-            print(f"✅ No bundles detected - launch appears organic")
+                logger.info("   Cluster %s: %s txs, %s wallets, score: %s", i+1, cluster.cluster_size, cluster.unique_wallets, cluster.score)
+        elif not bundled_detected:
+            logger.info("✅ No bundles detected - launch appears organic")
 
         # Calculate percentage of bundled transactions for user display
         if bundled_detected:
             # Count unique transactions that fall within any bundle cluster (avoid double counting)
-            bundled_tx_indices = set()
-            for cluster in bundle_clusters:
-                cluster_start = cluster.first_unix
-                cluster_end = cluster_start + cluster.window_seconds
-
-                for idx, tx in enumerate(transactions):
-                    tx_time = tx.get("block_unix_time") or tx.get("blockUnixTime", 0)
-                    if cluster_start <= tx_time <= cluster_end:
-                        bundled_tx_indices.add(idx)
-
-            unique_bundled_count = len(bundled_tx_indices)
+            unique_bundled_count = count_transactions_in_clusters(bundle_clusters, transactions)
             bundled_percentage = (unique_bundled_count / len(transactions) * 100) if transactions else 0
             analysis.meta["bundled_transaction_percentage"] = round(bundled_percentage, 1)
         else:
@@ -1723,7 +2141,7 @@ async def fetch_bundler_analysis(token_address: str) -> Optional[BundlerAnalysis
         return analysis
 
     except Exception as e:
-        print(f"❌ Bundler analysis failed: {str(e)}")
+        logger.error("❌ Bundler analysis failed: %s", e)
         return BundlerAnalysis(
             bundled_detected=False,
             bundle_cluster_count=0,
@@ -1754,17 +2172,14 @@ async def fetch_all_token_data(token_address: str, chain: str) -> Dict[str, Any]
         Dictionary containing market data, holder data, and token metadata
     """
 
-    print(f"🔍 Fetching market and holder data for {token_address} on {chain}")
-
-    # Create tasks for parallel fetching of independent data sources
-    tasks = []
+    logger.info("🔍 Fetching market and holder data for %s on %s", token_address, chain)
 
     # Task 1: Market data from BirdEye (required)
     async def fetch_market():
         try:
             return await fetch_birdeye_market_data(chain, token_address)
         except Exception as e:
-            print(f"❌ Failed to fetch market data: {str(e)}")
+            logger.error("❌ Failed to fetch market data: %s", e)
             # Try to provide helpful error message
             if "BIRDEYE_API_KEY" in str(e):
                 raise Exception("BIRDEYE_API_KEY not set. Please add it to your .env file")
@@ -1776,29 +2191,23 @@ async def fetch_all_token_data(token_address: str, chain: str) -> Dict[str, Any]
         try:
             holder_data = await fetch_moralis_holder_data(chain, token_address)
             if holder_data:
-                print(
-                    f"✅ Fetched holder data: {holder_data.total_holders} holders, "
-                    f"{holder_data.top10_concentration:.1f}% concentration"
+                logger.info(
+                    "✅ Fetched holder data: %s holders, %.1f%% concentration",
+                    holder_data.total_holders,
+                    holder_data.top10_concentration or 0
                 )
             return holder_data
         except Exception as e:
-            print(f"⚠️  Holder data unavailable: {str(e)}")
+            logger.warning("⚠️  Holder data unavailable: %s", e)
             return None
 
-    # Execute market and holder fetching in parallel
-    print(f"⚡ Fetching market and holder data in parallel...")
-    market_data, holder_data = await asyncio.gather(
-        fetch_market(),
-        fetch_holders()
-    )
-
     # Task 3: Bundler analysis for Solana tokens only
     async def fetch_bundler():
         if chain.lower() != "solana":
-            print(f"⚠️  Skipping bundler analysis for {chain} (Solana only feature)")
+            logger.warning("⚠️  Skipping bundler analysis for %s (Solana only feature)", chain)
             return None
         try:
-            print(f"🔍 Running bundler analysis for Solana token...")
+            logger.info("🔍 Running bundler analysis for Solana token...")
             bundler_analysis = await fetch_bundler_analysis(token_address)
             if bundler_analysis:
                 bundler_data = {
@@ -1845,12 +2254,12 @@ async def fetch_all_token_data(token_address: str, chain: str) -> Dict[str, Any]
 
                 # Log bundler results
                 if bundler_analysis.bundled_detected:
-                    print(f"🚨 Bundler analysis complete: {bundler_analysis.bundle_cluster_count} bundles detected")
+                    logger.info("🚨 Bundler analysis complete: %s bundles detected", bundler_analysis.bundle_cluster_count)
                 else:
-                    print(f"✅ Bundler analysis complete: No bundles detected")
+                    logger.info("✅ Bundler analysis complete: No bundles detected")
                 return bundler_data
         except Exception as e:
-            print(f"⚠️  Bundler analysis failed: {str(e)}")
+            logger.warning("⚠️  Bundler analysis failed: %s", e)
             return {
                 "bundled_detected": False,
                 "bundle_cluster_count": 0,
@@ -1867,7 +2276,7 @@ async def fetch_all_token_data(token_address: str, chain: str) -> Dict[str, Any]
     # Task 4: 24h market health analysis for all chains
     async def fetch_market_health():
         try:
-            print(f"📊 Running 24h market health analysis...")
+            logger.info("📊 Running 24h market health analysis...")
             market_health_analysis = await analyze_24h_market_health(token_address, chain)
             if market_health_analysis and market_health_analysis.get("market_health_available", False):
                 market_health_data = {
@@ -1888,7 +2297,7 @@ async def fetch_all_token_data(token_address: str, chain: str) -> Dict[str, Any]
                 "data_points": market_health_analysis.get("data_points"),
                 "analysis_note": market_health_analysis.get("analysis_note")
                 }
-                print(f"📈 Market health analysis complete: {market_health_data.get('market_health', 'N/A')}")
+                logger.info("📈 Market health analysis complete: %s", market_health_data.get('market_health', 'N/A'))
                 return market_health_data
             else:
                 # OHLCV data not available or insufficient
@@ -1897,10 +2306,10 @@ async def fetch_all_token_data(token_address: str, chain: str) -> Dict[str, Any]
                     "analysis_note": market_health_analysis.get("analysis_note", "Insufficient data"),
                     "data_points": market_health_analysis.get("data_points", 0)
                 }
-                print(f"⚠️  24h market health analysis unavailable: {market_health_data.get('analysis_note')}")
+                logger.warning("⚠️  24h market health analysis unavailable: %s", market_health_data.get('analysis_note'))
                 return market_health_data
         except Exception as e:
-            print(f"⚠️  24h market health analysis failed: {str(e)}")
+            logger.warning("⚠️  24h market health analysis failed: %s", e)
             return {
                 "market_health_available": False,
                 "error": str(e),
@@ -1911,25 +2320,37 @@ async def fetch_all_token_data(token_address: str, chain: str) -> Dict[str, Any]
     async def fetch_safety():
         try:
             from token_safety import analyze_token_safety
-            print(f"🔒 Fetching token safety analysis...")
+            logger.info("🔒 Fetching token safety analysis...")
             safety_result = await analyze_token_safety(token_address, chain)
             if safety_result.get("success"):
-                print(f"✅ Token safety analysis completed")
+                logger.info("✅ Token safety analysis completed")
                 return safety_result.get("analysis")
             else:
-                print(f"⚠️  Token safety analysis failed: {safety_result.get('error')}")
+                logger.warning("⚠️  Token safety analysis failed: %s", safety_result.get('error'))
                 return None
         except Exception as e:
-            print(f"⚠️  Token safety analysis failed: {str(e)}")
+            logger.warning("⚠️  Token safety analysis failed: %s", e)
             return None
 
-    # Execute bundler, market health, and safety analysis in parallel
-    print(f"⚡ Running bundler, market health, and safety analysis in parallel...")
-    bundler_data, market_health_data, safety_data = await asyncio.gather(
-        fetch_bundler(),
-        fetch_market_health(),
-        fetch_safety()
-    )
+    # None of the analyses depend on market or holder data, so run everything
+    # at once. Only the market fetch raises; the task group then cancels the
+    # rest, and its error is re-raised as is rather than as an ExceptionGroup.
+    logger.info("⚡ Fetching market, holder, bundler, market health, and safety data in parallel...")
+    try:
+        async with asyncio.TaskGroup() as tg:
+            market_task = tg.create_task(fetch_market())
+            holders_task = tg.create_task(fetch_holders())
+            bundler_task = tg.create_task(fetch_bundler())
+            market_health_task = tg.create_task(fetch_market_health())
+            safety_task = tg.create_task(fetch_safety())
+    except ExceptionGroup as group:
+        raise group.exceptions[0]
+
+    market_data = market_task.result()
+    holder_data = holders_task.result()
+    bundler_data = bundler_task.result()
+    market_health_data = market_health_task.result()
+    safety_data = safety_task.result()
 
     return {
         "token_address": token_address,
@@ -1958,4 +2379,35 @@ async def fetch_all_token_data(token_address: str, chain: str) -> Dict[str, Any]
         "bundler_analysis": bundler_data,
         "market_health_24h": market_health_data,
         "safety_analysis": safety_data,
-    }
\ No newline at end of file
+    }
+
+
+async def fetch_many_token_data(
+    tokens: List[Tuple[str, str]],
+    max_concurrent: int = 5
+) -> Dict[str, Union[Dict[str, Any], Exception]]:
+    """
+    Fetch all token data for several tokens concurrently.
+
+    Requests share the pooled session and per-API rate limits, so the batch
+    finishes in roughly the time of its slowest tokens rather than their sum.
+
+    Args:
+        tokens: (token_address, chain) tuples
+        max_concurrent: Maximum number of tokens fetched at once
+
+    Returns:
+        Dictionary mapping token address to its fetch_all_token_data result,
+        or to the exception raised for that token
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def fetch_one(token_address, chain):
+        async with semaphore:
+            return await fetch_all_token_data(token_address, chain)
+
+    results = await asyncio.gather(
+        *(fetch_one(token_address, chain) for token_address, chain in tokens),
+        return_exceptions=True
+    )
+    return {token_address: result for (token_address, _), result in zip(tokens, results)}
@@ -1,20 +1,19 @@
-import os
+from typing import Optional
 from agency_swarm import Agent, ModelSettings
 from agents.extensions.models.litellm_model import LitellmModel
-from dotenv import load_dotenv
+from settings import Settings, get_settings
 
-load_dotenv()
 
-
-def create_grok_narration_agent():
+def create_grok_narration_agent(settings: Optional[Settings] = None):
+    settings = settings or get_settings()
     return Agent(
         name="GrokNarrationAgent",
         description="Generates professional narrative sections from market data, holder statistics, and sentiment analysis using Grok reasoning",
         instructions="./instructions.md",
         tools_folder="./tools",
         model=LitellmModel(
-            model="xai/grok-4-fast-reasoning",
-            api_key=os.getenv("XAI_API_KEY")
+            model=settings.grok_narration_model,
+            api_key=settings.xai_api_key
         ),
         model_settings=ModelSettings(
             temperature=0.1,
@@ -1,5 +1,16 @@
+from functools import cache
+
+
 # Import the agent creation function instead of the agent instance
+@cache
 def get_grok_sentiment_agent():
+    """
+    Return the process-wide GrokSentiment agent, creating it on first call.
+
+    The instance is shared by every caller in the process; reconfiguring it
+    is not thread-safe, so build a fresh one with create_grok_sentiment_agent()
+    when different settings are needed.
+    """
     from .grok_sentiment_agent import create_grok_sentiment_agent
 
     return create_grok_sentiment_agent()
@@ -1,8 +1,8 @@
-import os
 import aiohttp
 from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import List, Dict
+from settings import get_settings
 
 
 class SearchTweetsAndAnalyze(BaseTool):
@@ -64,7 +64,7 @@ CRITICAL: Never output numeric confidence scores in your response. Use qualitati
     async def _search_tweets(self) -> List[Dict]:
         """Search for tweets about a token using TweetScout API"""
 
-        api_key = os.getenv("TWEET_SCOUT_ID")
+        api_key = get_settings().tweet_scout_id
         if not api_key:
             raise ValueError("TWEET_SCOUT_ID environment variable not set")
 
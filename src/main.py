@@ -11,13 +11,17 @@ A streamlined implementation that:
 
 import asyncio
 import argparse
+import logging
+import logging.handlers
 import os
+import queue
 import sys
 import re
 from typing import Dict, Any, Optional
 from datetime import datetime
 from cachetools import TTLCache
 from asyncio import Event
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 # Load environment variables FIRST (before imports that need them)
@@ -28,13 +32,12 @@ from fastapi import FastAPI, HTTPException, Depends, Body, Header, Request
 from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel
 
-# Add src directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-# Import after path modification (env vars are now loaded)
+# Sibling modules resolve from the script directory (python main.py) or the
+# working directory (uvicorn main:app), so no sys.path changes are needed.
+# Import after loading env vars
 try:
-    from data_fetchers import fetch_all_token_data
-    from token_search import search_tokens
+    from data_fetchers import fetch_all_token_data, EVM_ADDRESS_PATTERN
+    from token_search import search_tokens, TOKEN_ADDRESS_PATTERN, CASHTAG_PATTERN
     # Import telegram_handler instance (circular import resolved via lazy imports in telegram_handler.py)
     import telegram_handler as telegram_handler_module
     telegram_handler = telegram_handler_module.telegram_handler
@@ -43,6 +46,52 @@ except ImportError as e:
     print(f"Warning: Import error - {e}")
     telegram_handler = None
 
+# Queue-backed root log handler, installed by configure_logging()
+_log_handler: Optional[logging.handlers.QueueHandler] = None
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging() -> None:
+    """
+    Send module log records to stderr through a background thread.
+
+    Records are queued and written by a QueueListener so the event loop never
+    waits on the stream. Module loggers print like the rest of the app; set
+    LOG_LEVEL=WARNING to silence progress messages. Called from the server
+    lifespan and the CLI entry point rather than at import, so re-importing this
+    module (uvicorn.run("main:app") from `python main.py`) does not install a
+    second listener. Safe to call more than once.
+    """
+    global _log_handler, _log_listener
+
+    if _log_listener is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _log_handler = logging.handlers.QueueHandler(log_queue)
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_log_handler)
+    root_logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    _log_listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued log records and remove the handler added by configure_logging()"""
+    global _log_handler, _log_listener
+
+    if _log_listener is None:
+        return
+
+    logging.getLogger().removeHandler(_log_handler)
+    _log_listener.stop()
+    _log_handler = None
+    _log_listener = None
+
+
 # In-memory cache and deduplication setup
 # Cache analysis results for 5 minutes (300 seconds)
 analysis_cache = TTLCache(maxsize=1000, ttl=300)
@@ -51,11 +100,24 @@ analysis_cache = TTLCache(maxsize=1000, ttl=300)
 # Format: {cache_key: {'event': Event(), 'result': None, 'timestamp': datetime}}
 ongoing_analyses: Dict[str, Dict[str, Any]] = {}
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up logging on startup; release pooled HTTP connections on shutdown"""
+    configure_logging()
+    yield
+    from data_fetchers import close_session
+    from agency import close_shared_http_client
+    await close_session()
+    await close_shared_http_client()
+    stop_logging()
+
+
 # FastAPI app setup
 app = FastAPI(
     title="GoArlo Crypto Analysis API",
     description="API for token analysis and extraction",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Custom exception handler for validation errors
@@ -145,11 +207,16 @@ def holder_icon(concentration):
         return "🐚 DECENTRALIZED"
 
 
+# Solana addresses are base58 (no 0, O, I or l) and 32, 43 or 44 characters
+# long; EVM_ADDRESS_PATTERN comes from data_fetchers
+SOLANA_ADDRESS_PATTERN = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32}(?:[1-9A-HJ-NP-Za-km-z]{11,12})?")
+
+
 def detect_chain(address: str) -> str:
     """Auto-detect blockchain from address format"""
-    if address.startswith("0x") and len(address) == 42:
+    if EVM_ADDRESS_PATTERN.fullmatch(address):
         return "base"  # Default EVM chain
-    elif len(address) in [32, 43, 44] and address.isalnum():
+    elif SOLANA_ADDRESS_PATTERN.fullmatch(address):
         return "solana"
     else:
         raise ValueError(f"Cannot detect chain from address format: {address}")
@@ -361,6 +428,8 @@ def format_analysis_for_twitter(analysis_response: str, token_info: Dict[str, An
             # Show current impact risk with bomb icon
             current_risk = bundler.get('present_impact_analysis', {}).get('current_impact_risk', 'UNKNOWN')
             formatted_output += f"  🧨 Current Impact Risk: {current_risk}\n"
+        elif bundler.get('meta', {}).get('skipped'):
+            formatted_output += f"  ⏭️  SKIPPED: token launched {bundler['meta'].get('age_days', 0):.0f} days ago\n"
         else:
             formatted_output += "  ✅ NO BUNDLES DETECTED\n"
             formatted_output += "  🧨 Current Impact Risk: LOW\n"
@@ -512,7 +581,10 @@ async def post_twitter_reply(
         print(f"📝 Tweet content ({len(formatted_tweet)} chars):")
         print(f"   {formatted_tweet[:100]}{'...' if len(formatted_tweet) > 100 else ''}")
 
-        response = client.create_tweet(
+        # tweepy is synchronous; post from a worker thread so the event loop
+        # keeps serving other requests during the round trip
+        response = await asyncio.to_thread(
+            client.create_tweet,
             text=formatted_tweet,
             in_reply_to_tweet_id=reply_to_tweet
         )
@@ -750,6 +822,12 @@ async def analyze_token(
                 for i, cluster in enumerate(bundler_data['bundle_clusters'][:3]):  # Show max 3 clusters
                     bundler_section += f"""
         - Cluster {i+1}: {cluster['cluster_size']} txs, {cluster['unique_wallets']} wallets"""
+            elif bundler_data.get('meta', {}).get('skipped'):
+                bundler_section = f"""
+        BUNDLER ANALYSIS (Solana):
+        - Bundle Detection: SKIPPED (token launched {bundler_data['meta'].get('age_days', 0):.0f} days ago; launch-time bundling is no longer relevant)
+        - Creation Time: {bundler_data['creation_info']['created_at'] if bundler_data['creation_info'] else 'Unknown'}
+        - Risk Level: N/A"""
             else:
                 bundler_section = f"""
         BUNDLER ANALYSIS (Solana):
@@ -956,12 +1034,11 @@ async def extract_token_from_text(
             raise HTTPException(status_code=401, detail="Invalid API key")
     try:
         # Look for contract addresses first (prioritized over symbols)
-        address_pattern = r'\b[a-zA-Z0-9]{32,44}\b'
-        address_matches = re.findall(address_pattern, request.text)
+        address_match = TOKEN_ADDRESS_PATTERN.search(request.text)
 
-        if address_matches:
+        if address_match:
             # Use address search
-            contract_address = address_matches[0]
+            contract_address = address_match.group(0)
             search_results = await search_tokens(
                 keyword=contract_address,
                 search_by="address",
@@ -981,10 +1058,9 @@ async def extract_token_from_text(
             token_data = search_results[0]
         else:
             # Look for cashtags/symbols
-            cashtag_pattern = r'\$([A-Za-z0-9]+)(?=[\s.,!?]|$)'
-            cashtag_matches = re.findall(cashtag_pattern, request.text)
+            cashtag_match = CASHTAG_PATTERN.search(request.text)
 
-            if not cashtag_matches:
+            if not cashtag_match:
                 return TokenAnalysisResponse(
                     success=False,
                     message="No valid contract address or symbol found in text",
@@ -994,7 +1070,7 @@ async def extract_token_from_text(
                 )
 
             # Use symbol search
-            token_symbol = cashtag_matches[0]
+            token_symbol = cashtag_match.group(1)
             search_results = await search_tokens(
                 keyword=token_symbol,
                 search_by="symbol",
@@ -1255,6 +1331,8 @@ Examples:
                     if bundler.get("present_impact_analysis"):
                         impact = bundler["present_impact_analysis"]
                         print(f"  🧨 Current Impact Risk: {impact.get('current_impact_risk', 'N/A')}")
+                elif bundler.get("meta", {}).get("skipped"):
+                    print(f"  ⏭️  SKIPPED: token launched {bundler['meta'].get('age_days', 0):.0f} days ago")
                 else:
                     print(f"  ✅ NO BUNDLES DETECTED")
                     print(f"  🧨 Current Impact Risk: LOW")
@@ -1326,6 +1404,11 @@ Examples:
         import traceback
 
         traceback.print_exc()
+    finally:
+        from data_fetchers import close_session
+        from agency import close_shared_http_client
+        await close_session()
+        await close_shared_http_client()
 
 
 if __name__ == "__main__":
@@ -1334,7 +1417,11 @@ if __name__ == "__main__":
 
     if is_cli_mode:
         sys.argv.pop(1)
-        asyncio.run(main())
+        configure_logging()
+        try:
+            asyncio.run(main())
+        finally:
+            stop_logging()
     else:
         import uvicorn
 
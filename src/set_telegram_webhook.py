@@ -8,12 +8,8 @@ Run this script after deploying your application to register the webhook.
 
 import asyncio
 import os
-import sys
 from dotenv import load_dotenv
 
-# Add current directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from telegram_handler import set_telegram_webhook
 
 load_dotenv()
@@ -0,0 +1,46 @@
+"""
+Typed configuration for the agency and its agents.
+
+Values come from the process environment first, then from src/.env. The
+file is parsed once per process; call get_settings() instead of re-reading
+environment variables in each module.
+"""
+
+from functools import cache
+from pathlib import Path
+from typing import Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Resolved once so settings do not depend on the current working directory
+ENV_FILE = Path(__file__).resolve().parent / ".env"
+
+
+class Settings(BaseSettings):
+    """Environment-backed settings for the Grok agents"""
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        env_ignore_empty=True,
+        extra="ignore",
+    )
+
+    xai_api_key: Optional[str] = None
+    tweet_scout_id: Optional[str] = None
+
+    # Ops can point sentiment at a cheaper/quantized Grok SKU without a code change.
+    # Narration stays on the full model since prose quality is more sensitive.
+    grok_sentiment_model: str = "xai/grok-4-fast-reasoning"
+    grok_narration_model: str = "xai/grok-4-fast-reasoning"
+
+    # Upper bound on in-flight agency requests, sized to the Grok rate limit
+    grok_max_concurrency: int = 4
+
+    # Prompts packed into a single agency request by run_batch()
+    grok_batch_size: int = 4
+
+
+@cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing the environment on first call"""
+    return Settings()
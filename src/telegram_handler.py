@@ -7,14 +7,19 @@ Provides intelligent handling of addresses, cashtags, and multiple results.
 """
 
 import os
-import re
 import asyncio
 import aiohttp
 from typing import Dict, Any, Optional, List, Tuple
 from fastapi import Request
 from dotenv import load_dotenv
 
-from token_search import search_tokens, TokenSearchResult, SUPPORTED_CHAINS
+from token_search import (
+    search_tokens,
+    TokenSearchResult,
+    SUPPORTED_CHAINS,
+    TOKEN_ADDRESS_PATTERN,
+    CASHTAG_PATTERN,
+)
 # Avoid circular import - analyze_token and format_analysis_for_twitter imported lazily in functions
 
 load_dotenv()
@@ -131,12 +136,11 @@ class TelegramHandler:
             Dict with parsing results and token data
         """
         # Priority 1: Look for contract addresses (32-44 characters alphanumeric)
-        address_pattern = r'\b[a-zA-Z0-9]{32,44}\b'
-        address_matches = re.findall(address_pattern, text)
+        address_match = TOKEN_ADDRESS_PATTERN.search(text)
 
-        if address_matches:
+        if address_match:
             # Use first address if multiple found
-            contract_address = address_matches[0]
+            contract_address = address_match.group(0)
             print(f"Found contract address: {contract_address}")
 
             search_results = await search_tokens(contract_address, search_by="address")
@@ -164,12 +168,11 @@ class TelegramHandler:
             }
 
         # Priority 2: Look for cashtags ($TOKEN)
-        cashtag_pattern = r'\$([A-Za-z0-9]+)(?=[\s.,!?]|$)'
-        cashtag_matches = re.findall(cashtag_pattern, text)
+        cashtag_match = CASHTAG_PATTERN.search(text)
 
-        if cashtag_matches:
+        if cashtag_match:
             # Use first cashtag if multiple found
-            token_symbol = cashtag_matches[0]
+            token_symbol = cashtag_match.group(1)
             print(f"Found cashtag: ${token_symbol}")
 
             search_results = await search_tokens(token_symbol, search_by="symbol")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test script for the agency orchestration helpers
+Tests batch reply parsing and the sentiment -> narration pipeline with mocked agents
+
+No API keys are needed: the agency is replaced with fakes, so these tests never
+reach the model.
+"""
+
+import asyncio
+import sys
+import os
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
+
+# Add parent directory to path to import agency
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from agency import _parse_batch_output, piped_run, run_many, run_batch
+
+
+def test_parse_batch_output_valid():
+    """A well-formed array is split into one string per request"""
+    print("🧪 Testing batch reply parsing")
+    print("-" * 40)
+
+    assert _parse_batch_output('["first", "second"]', 2) == ["first", "second"]
+
+    # Models sometimes wrap the array in a markdown code fence
+    fenced = '```json\n["first", "second"]\n```'
+    assert _parse_batch_output(fenced, 2) == ["first", "second"]
+    print("✅ Valid and fenced replies parsed")
+
+
+def test_parse_batch_output_malformed_json():
+    """Replies that are not a JSON array are rejected"""
+    assert _parse_batch_output('["first", "second"', 2) is None
+    assert _parse_batch_output('["first", second]', 2) is None
+    assert _parse_batch_output("no array here", 2) is None
+    assert _parse_batch_output("", 2) is None
+    assert _parse_batch_output(None, 2) is None
+    print("✅ Malformed replies rejected")
+
+
+def test_parse_batch_output_wrong_count():
+    """A reply with more or fewer answers than requests is rejected"""
+    assert _parse_batch_output('["only one"]', 2) is None
+    assert _parse_batch_output('["a", "b", "c"]', 2) is None
+    assert _parse_batch_output("[]", 1) is None
+    print("✅ Wrong-length replies rejected")
+
+
+def test_parse_batch_output_non_string_items():
+    """Non-string answers are kept in their slot as JSON text"""
+    parsed = _parse_batch_output('["text", {"score": 1}, 3, null]', 4)
+    assert parsed == ["text", '{"score":1}', "3", "null"]
+    print("✅ Non-string items serialized in place")
+
+
+def _delta_event(text):
+    """Build a streamed text-delta event like the ones the agency yields"""
+    return SimpleNamespace(data=SimpleNamespace(type="response.output_text.delta", delta=text))
+
+
+def _fake_agency(stream_events, fail_after=None):
+    """Agency stand-in whose sentiment stream yields events and optionally fails"""
+    async def get_response_stream(message, recipient_agent=None):
+        for index, event in enumerate(stream_events):
+            if index == fail_after:
+                raise ConnectionError("sentiment stream dropped")
+            yield event
+        if fail_after == len(stream_events):
+            raise ConnectionError("sentiment stream dropped")
+
+    return SimpleNamespace(
+        get_response_stream=get_response_stream,
+        get_response=AsyncMock(return_value=SimpleNamespace(final_output="narration")),
+    )
+
+
+def test_piped_run_narrates_full_stream():
+    """The narration agent receives the complete sentiment analysis"""
+    print("\n🧪 Testing sentiment -> narration pipeline")
+    print("-" * 40)
+
+    fake = _fake_agency([_delta_event("Bullish "), _delta_event("momentum")])
+    with patch("agency.get_agency", return_value=fake):
+        output = asyncio.run(piped_run("Token: TEST"))
+
+    assert output == "narration"
+    fake.get_response.assert_awaited_once()
+    message = fake.get_response.await_args.args[0]
+    assert message.endswith("SENTIMENT ANALYSIS:\nBullish momentum")
+    assert fake.get_response.await_args.kwargs["recipient_agent"] == "GrokNarrationAgent"
+    print("✅ Full analysis forwarded to narration")
+
+
+def test_piped_run_stream_failure_skips_narration():
+    """A sentiment stream that fails part way never reaches the narration agent"""
+    for fail_after in (0, 1, 2):
+        fake = _fake_agency([_delta_event("Bullish "), _delta_event("momentum")], fail_after=fail_after)
+        with patch("agency.get_agency", return_value=fake):
+            try:
+                asyncio.run(piped_run("Token: TEST"))
+            except ConnectionError as e:
+                assert str(e) == "sentiment stream dropped"
+            else:
+                raise AssertionError("stream failure was not raised")
+
+        fake.get_response.assert_not_awaited()
+    print("✅ Stream failures raised without calling narration")
+
+
+def test_run_helpers_reject_non_positive_limits():
+    """Zero or negative concurrency and batch sizes fail fast instead of hanging"""
+    print("\n🧪 Testing run limit validation")
+    print("-" * 40)
+
+    fake = _fake_agency([])
+    calls = (
+        lambda: run_many(["a"], concurrency=0),
+        lambda: run_many(["a"], concurrency=-1),
+        lambda: run_batch(["a"], batch_size=0, concurrency=2),
+        lambda: run_batch(["a"], batch_size=-2, concurrency=2),
+        lambda: run_batch(["a"], batch_size=2, concurrency=0),
+    )
+    with patch("agency.get_agency", return_value=fake):
+        for call in calls:
+            try:
+                asyncio.run(call())
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("non-positive limit was accepted")
+
+    fake.get_response.assert_not_awaited()
+    print("✅ Non-positive limits rejected")
+
+
+if __name__ == "__main__":
+    print("🚀 Running Agency Helper Tests")
+    print("=" * 50)
+
+    test_parse_batch_output_valid()
+    test_parse_batch_output_malformed_json()
+    test_parse_batch_output_wrong_count()
+    test_parse_batch_output_non_string_items()
+    test_piped_run_narrates_full_stream()
+    test_piped_run_stream_failure_skips_narration()
+    test_run_helpers_reject_non_positive_limits()
+
+    print("\n" + "=" * 50)
+    print("🎉 All agency helper tests completed!")
@@ -13,6 +13,7 @@ This script tests the bundler analysis integration for bundle detection.
 import asyncio
 import sys
 import os
+import orjson
 from unittest.mock import patch, AsyncMock
 from dotenv import load_dotenv
 
@@ -30,6 +31,7 @@ try:
         detect_bundles,
         fetch_bundler_analysis,
         fetch_all_token_data,
+        close_session,
         BundleCluster,
         CreationInfo,
         BundlerAnalysis
@@ -146,7 +148,7 @@ async def test_creation_info_api():
         # Mock the context manager
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=mock_response_data)
+        mock_response.read = AsyncMock(return_value=orjson.dumps(mock_response_data))
         mock_get.return_value.__aenter__.return_value = mock_response
 
         try:
@@ -211,7 +213,7 @@ async def test_transactions_api():
     with patch('aiohttp.ClientSession.get') as mock_get:
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=mock_transactions_data)
+        mock_response.read = AsyncMock(return_value=orjson.dumps(mock_transactions_data))
         mock_get.return_value.__aenter__.return_value = mock_response
 
         try:
@@ -270,7 +272,9 @@ async def test_bundler_analysis_integration():
         }
     }
 
-    with patch('aiohttp.ClientSession.get') as mock_get:
+    # The mocked launch is from 2023, so lift the age cutoff to exercise the full analysis
+    with patch('aiohttp.ClientSession.get') as mock_get, \
+            patch('data_fetchers.BUNDLER_MAX_TOKEN_AGE_DAYS', float('inf')):
         # Mock responses for both API calls
         def mock_response_side_effect(*args, **kwargs):
             mock_response = AsyncMock()
@@ -279,9 +283,9 @@ async def test_bundler_analysis_integration():
             # Check URL to determine which response to return
             url = args[0] if args else kwargs.get('url', '')
             if 'token_creation_info' in url:
-                mock_response.json = AsyncMock(return_value=mock_creation_data)
+                mock_response.read = AsyncMock(return_value=orjson.dumps(mock_creation_data))
             elif 'token/txs' in url:
-                mock_response.json = AsyncMock(return_value=mock_transactions_data)
+                mock_response.read = AsyncMock(return_value=orjson.dumps(mock_transactions_data))
 
             return mock_response
 
@@ -309,6 +313,43 @@ async def test_bundler_analysis_integration():
             print(f"❌ Integration test failed: {str(e)}")
 
 
+async def test_bundler_analysis_skips_old_tokens():
+    """Test that tokens launched past the age cutoff skip the bundler analysis"""
+    print("\n🧪 Testing Bundler Analysis Age Cutoff")
+    print("-" * 40)
+
+    # Launched in 2023, well past BUNDLER_MAX_TOKEN_AGE_DAYS
+    mock_creation_data = {
+        "data": {
+            "blockUnixTime": 1697043429,
+            "blockHumanTime": "2023-10-11T17:07:09Z",
+            "txHash": "old_creation_hash"
+        }
+    }
+
+    with patch('aiohttp.ClientSession.get') as mock_get, \
+            patch('data_fetchers.BIRDEYE_API_KEY', 'test_key'):
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.read = AsyncMock(return_value=orjson.dumps(mock_creation_data))
+        mock_get.return_value.__aenter__.return_value = mock_response
+
+        analysis = await fetch_bundler_analysis("old_test_token_address")
+
+        requested_urls = [call.args[0] for call in mock_get.call_args_list]
+
+    assert analysis is not None
+    assert analysis.meta.get("skipped") == "token_too_old"
+    assert analysis.meta["age_days"] > 30
+    assert not analysis.bundled_detected
+    assert analysis.bundle_cluster_count == 0
+    assert analysis.creation_info.block_unix_time == 1697043429
+    # Only the creation info is fetched; no transaction history is requested
+    assert len(requested_urls) == 1 and "token_creation_info" in requested_urls[0]
+
+    print(f"✅ Old token skipped: {analysis.meta}")
+
+
 async def run_all_tests():
     """Run all bundler tests"""
     if not BUNDLER_API_AVAILABLE:
@@ -318,15 +359,20 @@ async def run_all_tests():
     print("🚀 Running Bundler Analysis Tests")
     print("=" * 50)
 
-    # Test 1: Algorithm logic
-    test_bundle_detection_algorithm()
+    try:
+        # Test 1: Algorithm logic
+        test_bundle_detection_algorithm()
 
-    # Test 2: API functions with mocks
-    await test_creation_info_api()
-    await test_transactions_api()
+        # Test 2: API functions with mocks
+        await test_creation_info_api()
+        await test_transactions_api()
 
-    # Test 3: Integration test
-    await test_bundler_analysis_integration()
+        # Test 3: Integration tests
+        await test_bundler_analysis_integration()
+        await test_bundler_analysis_skips_old_tokens()
+    finally:
+        # The fetchers share one aiohttp session; close it before the loop ends
+        await close_session()
 
     print("\n" + "=" * 50)
     print("🎉 All bundler tests completed!")
@@ -405,6 +451,8 @@ async def test_real_token(token_address: str):
         print(f"❌ Real token test failed: {str(e)}")
         import traceback
         traceback.print_exc()
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Test script for the data fetcher building blocks
+Tests the OHLCV response cache, in-flight request sharing, the API rate
+limiter and the circuit breaker with a mocked HTTP session
+
+No API keys are needed: the shared session is replaced with a fake that counts
+requests, so these tests never reach BirdEye or Moralis.
+"""
+
+import asyncio
+import sys
+import os
+import threading
+import time
+import orjson
+from unittest.mock import patch
+
+# Add parent directory to path to import data_fetchers
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from data_fetchers import (
+    fetch_ohlcv_data,
+    fetch_token_transactions,
+    ohlcv_cache,
+    CircuitBreaker,
+    RateLimiter,
+    OHLCV_CACHE_TTL,
+)
+
+MOCK_CANDLES = {
+    "success": True,
+    "data": {
+        "items": [
+            {"unix_time": 1000, "open": 1.0, "high": 1.2, "low": 0.9, "close": 1.1, "volume": 10},
+            {"unix_time": 1900, "open": 1.1, "high": 1.3, "low": 1.0, "close": 1.2, "volume": 12},
+        ]
+    }
+}
+
+
+class FakeResponse:
+    """Async context manager standing in for an aiohttp response"""
+
+    def __init__(self, payload, status=200, delay=0.0):
+        self.status = status
+        self.payload = payload
+        self.delay = delay
+
+    async def __aenter__(self):
+        # Keeps the request in flight so concurrent callers can overlap
+        await asyncio.sleep(self.delay)
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def read(self):
+        return orjson.dumps(self.payload)
+
+    async def text(self):
+        return "error"
+
+
+class FakeSession:
+    """Session stand-in that counts requests and answers with one payload"""
+
+    def __init__(self, payload, delay=0.0):
+        self.payload = payload
+        self.delay = delay
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return FakeResponse(self.payload, delay=self.delay)
+
+
+def run_with_session(session, coro_factory):
+    """Run a coroutine with the fake session, a fresh breaker and an empty OHLCV cache"""
+    async def get_fake_session():
+        return session
+
+    ohlcv_cache.clear()
+    with patch('data_fetchers.get_session', get_fake_session), \
+            patch('data_fetchers.BIRDEYE_API_KEY', 'test_key'), \
+            patch('data_fetchers.birdeye_breaker', CircuitBreaker("BirdEye")):
+        return asyncio.run(coro_factory())
+
+
+def test_ohlcv_cache_hit_within_ttl():
+    """A repeated OHLCV query within the TTL is served from the cache"""
+    print("🧪 Testing OHLCV cache")
+    print("-" * 40)
+
+    session = FakeSession(MOCK_CANDLES)
+    now = int(time.time())
+
+    async def fetch_twice():
+        first = await fetch_ohlcv_data("cache_token", now - 3600, now, timeframe="15m")
+        second = await fetch_ohlcv_data("cache_token", now - 3600, now, timeframe="15m")
+        return first, second
+
+    first, second = run_with_session(session, fetch_twice)
+
+    assert len(first) == 2
+    assert second == first
+    assert session.calls == 1
+    print("✅ Second query served from cache")
+
+
+def test_ohlcv_cache_refetches_after_ttl():
+    """An OHLCV entry past its timeframe's TTL is fetched again"""
+    session = FakeSession(MOCK_CANDLES)
+    now = int(time.time())
+
+    async def fetch_across_expiry():
+        await fetch_ohlcv_data("expiry_token", now - 3600, now, timeframe="15m")
+        # Advance the cache clock past the 15m TTL instead of sleeping
+        ohlcv_cache.expire(time.monotonic() + OHLCV_CACHE_TTL["15m"] + 1)
+        await fetch_ohlcv_data("expiry_token", now - 3600, now, timeframe="15m")
+
+    run_with_session(session, fetch_across_expiry)
+
+    assert session.calls == 2
+    print("✅ Expired entry fetched again")
+
+
+def test_ohlcv_failures_are_not_cached():
+    """An empty or failed OHLCV response is retried on the next call"""
+    session = FakeSession({"success": False, "data": {}})
+    now = int(time.time())
+
+    async def fetch_twice():
+        await fetch_ohlcv_data("empty_token", now - 3600, now, timeframe="15m")
+        await fetch_ohlcv_data("empty_token", now - 3600, now, timeframe="15m")
+
+    run_with_session(session, fetch_twice)
+
+    assert session.calls == 2
+    print("✅ Empty responses not cached")
+
+
+def test_concurrent_ohlcv_callers_share_one_request():
+    """N concurrent callers for the same window make exactly one HTTP request"""
+    print("\n🧪 Testing in-flight OHLCV sharing")
+    print("-" * 40)
+
+    session = FakeSession(MOCK_CANDLES, delay=0.05)
+    now = int(time.time())
+    callers = 10
+
+    async def fetch_concurrently():
+        return await asyncio.gather(*(
+            fetch_ohlcv_data("shared_token", now - 3600, now, timeframe="15m")
+            for _ in range(callers)
+        ))
+
+    results = run_with_session(session, fetch_concurrently)
+
+    assert session.calls == 1
+    assert len(results) == callers
+    assert all(result == results[0] and len(result) == 2 for result in results)
+    print(f"✅ {callers} concurrent callers, {session.calls} request")
+
+
+def test_inflight_requests_are_scoped_per_loop():
+    """Callers on different event loops never join each other's requests"""
+    session = FakeSession(MOCK_CANDLES, delay=0.2)
+    now = int(time.time())
+    results, errors = [], []
+
+    async def get_fake_session():
+        return session
+
+    def fetch_on_own_loop():
+        try:
+            results.append(asyncio.run(
+                fetch_ohlcv_data("loop_token", now - 3600, now, timeframe="15m")
+            ))
+        except Exception as e:
+            errors.append(e)
+
+    ohlcv_cache.clear()
+    with patch('data_fetchers.get_session', get_fake_session), \
+            patch('data_fetchers.BIRDEYE_API_KEY', 'test_key'), \
+            patch('data_fetchers.birdeye_breaker', CircuitBreaker("BirdEye")):
+        threads = [threading.Thread(target=fetch_on_own_loop) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert not errors, errors
+    assert len(results) == 2 and all(len(result) == 2 for result in results)
+    # Both loops started while the other's request was pending: one request each
+    assert session.calls == 2
+    print("✅ Concurrent loops fetched independently")
+
+
+def test_transactions_non_positive_limit_skips_request():
+    """A transaction limit of zero or below returns nothing without calling BirdEye"""
+    print("\n🧪 Testing transaction paging")
+    print("-" * 40)
+
+    session = FakeSession({"success": True, "data": {"items": []}})
+
+    async def fetch_with_limits():
+        return [await fetch_token_transactions("limit_token", limit=limit) for limit in (0, -5)]
+
+    results = run_with_session(session, fetch_with_limits)
+
+    assert results == [[], []]
+    assert session.calls == 0
+    print("✅ Non-positive limits made no requests")
+
+
+def test_rate_limiter_caps_concurrency():
+    """No more than max_concurrency requests run inside the limiter at once"""
+    print("\n🧪 Testing rate limiter")
+    print("-" * 40)
+
+    limiter = RateLimiter(rate=1000, period=1.0, max_concurrency=3)
+    active = 0
+    peak = 0
+
+    async def request():
+        nonlocal active, peak
+        async with limiter:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+
+    async def run_requests():
+        await asyncio.gather(*(request() for _ in range(12)))
+
+    asyncio.run(run_requests())
+
+    assert peak == 3
+    assert active == 0
+    print(f"✅ Peak concurrency {peak}")
+
+
+def test_rate_limiter_paces_bursts():
+    """A burst beyond the bucket size is spread out at the configured rate"""
+    limiter = RateLimiter(rate=5, period=0.5, max_concurrency=20)
+    start_times = []
+
+    async def request():
+        async with limiter:
+            start_times.append(time.monotonic())
+
+    async def run_requests():
+        start = time.monotonic()
+        await asyncio.gather(*(request() for _ in range(10)))
+        return start
+
+    start = asyncio.run(run_requests())
+    offsets = sorted(t - start for t in start_times)
+
+    # The first 5 use the full bucket; the other 5 wait 0.1s apart for refills
+    assert all(offset < 0.05 for offset in offsets[:5])
+    assert offsets[-1] >= 0.45
+    print(f"✅ 10 requests at 5 per 0.5s took {offsets[-1]:.2f}s")
+
+
+def test_rate_limiter_releases_slot_on_cancel():
+    """A request cancelled while waiting for a token frees its concurrency slot"""
+    limiter = RateLimiter(rate=1, period=10.0, max_concurrency=1)
+
+    async def run_requests():
+        async with limiter:
+            pass
+
+        # The bucket is empty, so this waits ~10s for a token while holding the slot
+        waiter = asyncio.create_task(limiter.__aenter__())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            pass
+
+        return limiter._semaphore().locked()
+
+    assert asyncio.run(run_requests()) is False
+    print("✅ Cancelled waiter released its slot")
+
+
+def test_circuit_breaker_opens_after_threshold():
+    """The breaker refuses calls once failure_threshold failures are recorded"""
+    print("\n🧪 Testing circuit breaker")
+    print("-" * 40)
+
+    breaker = CircuitBreaker("Test", failure_threshold=3, recovery_timeout=60.0)
+
+    for _ in range(2):
+        breaker.record_failure()
+        assert breaker.state == "CLOSED"
+        assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == "OPEN"
+    assert not breaker.allow_request()
+    print("✅ Opened after 3 failures")
+
+
+def test_circuit_breaker_counts_only_server_errors():
+    """5xx and 429 responses count as failures; other statuses reset the count"""
+    breaker = CircuitBreaker("Test", failure_threshold=2, recovery_timeout=60.0)
+
+    breaker.record_response(500)
+    breaker.record_response(404)
+    assert breaker.failure_count == 0
+
+    breaker.record_response(429)
+    breaker.record_response(503)
+    assert breaker.state == "OPEN"
+    print("✅ Only 5xx/429 responses trip the breaker")
+
+
+def test_circuit_breaker_half_opens_after_cooldown():
+    """After the cooldown one trial call is allowed, and its outcome decides the state"""
+    breaker = CircuitBreaker("Test", failure_threshold=1, recovery_timeout=60.0)
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    # Move the opening time back past the cooldown instead of sleeping
+    breaker.opened_at -= breaker.recovery_timeout
+    assert breaker.allow_request()
+    assert breaker.state == "HALF_OPEN"
+    # Only the one trial call goes through until it reports back
+    assert not breaker.allow_request()
+
+    # A failed trial re-opens the breaker for another cooldown
+    breaker.record_failure()
+    assert breaker.state == "OPEN"
+    assert not breaker.allow_request()
+
+    # A successful trial closes it
+    breaker.opened_at -= breaker.recovery_timeout
+    assert breaker.allow_request()
+    breaker.record_response(200)
+    assert breaker.state == "CLOSED"
+    assert breaker.failure_count == 0
+    assert breaker.allow_request()
+    print("✅ Half-open trial closes or re-opens the breaker")
+
+
+if __name__ == "__main__":
+    print("🚀 Running Data Fetcher Primitive Tests")
+    print("=" * 50)
+
+    test_ohlcv_cache_hit_within_ttl()
+    test_ohlcv_cache_refetches_after_ttl()
+    test_ohlcv_failures_are_not_cached()
+    test_concurrent_ohlcv_callers_share_one_request()
+    test_inflight_requests_are_scoped_per_loop()
+    test_transactions_non_positive_limit_skips_request()
+    test_rate_limiter_caps_concurrency()
+    test_rate_limiter_paces_bursts()
+    test_rate_limiter_releases_slot_on_cancel()
+    test_circuit_breaker_opens_after_threshold()
+    test_circuit_breaker_counts_only_server_errors()
+    test_circuit_breaker_half_opens_after_cooldown()
+
+    print("\n" + "=" * 50)
+    print("🎉 All data fetcher primitive tests completed!")
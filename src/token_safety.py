@@ -9,9 +9,10 @@ and various risk factors.
 
 import os
 import asyncio
-import aiohttp
+import orjson
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
+from data_fetchers import BIRDEYE_CHAIN_MAP, birdeye_limiter, get_session
 
 load_dotenv()
 
@@ -64,17 +65,7 @@ class TokenSafetyAnalyzer:
     async def _fetch_safety_data(self, token_address: str, chain: str) -> Optional[Dict]:
         """Fetch token security data from BirdEye API"""
 
-        # Map chain names to BirdEye format
-        chain_mapping = {
-            "solana": "solana",
-            "ethereum": "ethereum",
-            "base": "base",
-            "bnb": "bsc",
-            "bsc": "bsc",
-            "shibarium": "shibarium"
-        }
-
-        birdeye_chain = chain_mapping.get(chain.lower(), chain.lower())
+        birdeye_chain = BIRDEYE_CHAIN_MAP.get(chain.lower(), chain.lower())
 
         url = f"{self.base_url}/defi/token_security"
         headers = {
@@ -84,13 +75,13 @@ class TokenSafetyAnalyzer:
         }
         params = {"address": token_address}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if data.get("success") and data.get("data"):
-                        return data["data"]
-                return None
+        session = await get_session()
+        async with birdeye_limiter, session.get(url, headers=headers, params=params, timeout=30) as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                if data.get("success") and data.get("data"):
+                    return data["data"]
+            return None
 
     def _analyze_solana_token(self, data: Dict) -> Dict[str, Any]:
         """Analyze Solana token safety"""
@@ -6,9 +6,11 @@ Handles token search functionality using BirdEye API with filtering for supporte
 """
 
 import os
-import aiohttp
+import re
+import orjson
 from typing import List, Optional
 from pydantic import BaseModel
+from data_fetchers import birdeye_limiter, get_session, BIRDEYE_CHAIN_MAP, SUPPORTED_CHAINS
 
 
 class TokenSearchResult(BaseModel):
@@ -29,8 +31,11 @@ class TokenSearchResult(BaseModel):
     source: Optional[str] = None
 
 
-# Supported blockchain networks
-SUPPORTED_CHAINS = ["solana", "ethereum", "base", "bsc", "shibarium"]
+# Token mentions in free-form user text, compiled once for the webhook handlers:
+# a 32-44 character contract address, or a $CASHTAG followed by whitespace,
+# punctuation or the end of the text
+TOKEN_ADDRESS_PATTERN = re.compile(r'\b[a-zA-Z0-9]{32,44}\b')
+CASHTAG_PATTERN = re.compile(r'\$([A-Za-z0-9]+)(?=[\s.,!?]|$)')
 
 
 def safe_float(value) -> Optional[float]:
@@ -85,70 +90,61 @@ async def search_tokens(
         "ui_amount_mode": "scaled"
     }
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(url, headers=headers, params=params, timeout=30) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"BirdEye search API error: {response.status} - {error_text}")
-
-                data = await response.json()
-
-                if not data.get("success") or not data.get("data", {}).get("items"):
-                    print(f"⚠️  No search results found for '{keyword}'")
-                    return []
-
-                # Extract and filter token results
-                results = []
-                items = data["data"]["items"]
-
-                for item in items:
-                    if item.get("type") == "token" and item.get("result"):
-                        for token_data in item["result"]:
-                            network = token_data.get("network", "").lower()
-
-                            # Map network names to our supported chains
-                            network_mapping = {
-                                "solana": "solana",
-                                "ethereum": "ethereum",
-                                "base": "base",
-                                "bsc": "bsc",
-                                "bnb": "bsc",  # Map bnb to bsc
-                                "shibarium": "shibarium"
-                            }
-
-                            mapped_network = network_mapping.get(network, network)
-
-                            # Only include tokens from supported chains
-                            if mapped_network in SUPPORTED_CHAINS:
-                                try:
-                                    token_result = TokenSearchResult(
-                                        name=token_data.get("name", "Unknown"),
-                                        symbol=token_data.get("symbol", "Unknown"),
-                                        address=token_data.get("address", ""),
-                                        network=mapped_network,
-                                        decimals=token_data.get("decimals"),
-                                        logo_uri=token_data.get("logo_uri"),
-                                        fdv=safe_float(token_data.get("fdv")),
-                                        liquidity=safe_float(token_data.get("liquidity")),
-                                        price=safe_float(token_data.get("price")),
-                                        price_change_24h_percent=safe_float(token_data.get("price_change_24h_percent")),
-                                        volume_24h_usd=safe_float(token_data.get("volume_24h_usd")),
-                                        market_cap=safe_float(token_data.get("market_cap")),
-                                        verified=token_data.get("verified", False),
-                                        source=token_data.get("source")
-                                    )
-                                    results.append(token_result)
-                                except Exception as e:
-                                    print(f"⚠️  Error parsing token result: {str(e)}")
-                                    continue
-
-                print(f"✅ Found {len(results)} verified tokens on supported chains")
-                return results
-
-        except Exception as e:
-            print(f"❌ Token search failed: {str(e)}")
-            raise
+    session = await get_session()
+    try:
+        async with birdeye_limiter, session.get(url, headers=headers, params=params, timeout=30) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"BirdEye search API error: {response.status} - {error_text}")
+
+            data = orjson.loads(await response.read())
+
+            if not data.get("success") or not data.get("data", {}).get("items"):
+                print(f"⚠️  No search results found for '{keyword}'")
+                return []
+
+            # Extract and filter token results
+            results = []
+            items = data["data"]["items"]
+
+            for item in items:
+                if item.get("type") == "token" and item.get("result"):
+                    for token_data in item["result"]:
+                        network = token_data.get("network", "").lower()
+
+                        # Map BirdEye network names to our supported chains (bnb -> bsc)
+                        mapped_network = BIRDEYE_CHAIN_MAP.get(network, network)
+
+                        # Only include tokens from supported chains
+                        if mapped_network in SUPPORTED_CHAINS:
+                            try:
+                                token_result = TokenSearchResult(
+                                    name=token_data.get("name", "Unknown"),
+                                    symbol=token_data.get("symbol", "Unknown"),
+                                    address=token_data.get("address", ""),
+                                    network=mapped_network,
+                                    decimals=token_data.get("decimals"),
+                                    logo_uri=token_data.get("logo_uri"),
+                                    fdv=safe_float(token_data.get("fdv")),
+                                    liquidity=safe_float(token_data.get("liquidity")),
+                                    price=safe_float(token_data.get("price")),
+                                    price_change_24h_percent=safe_float(token_data.get("price_change_24h_percent")),
+                                    volume_24h_usd=safe_float(token_data.get("volume_24h_usd")),
+                                    market_cap=safe_float(token_data.get("market_cap")),
+                                    verified=token_data.get("verified", False),
+                                    source=token_data.get("source")
+                                )
+                                results.append(token_result)
+                            except Exception as e:
+                                print(f"⚠️  Error parsing token result: {str(e)}")
+                                continue
+
+            print(f"✅ Found {len(results)} verified tokens on supported chains")
+            return results
+
+    except Exception as e:
+        print(f"❌ Token search failed: {str(e)}")
+        raise
 
 
 def display_search_results(search_result: dict) -> None: